@@ -2,8 +2,17 @@
 import os
 import re
 import glob
-import subprocess
+import json
 import sys
+from datetime import datetime
+
+from Freqtrade_Cpu_Planner import planned_cpus
+from Freqtrade_Run_History import (
+    get_strategy_timeframe,
+    load_backtest_result,
+    load_json_config,
+    run_recorded,
+)
 
 # =====================================================================================
 # Default parameters (match your PowerShell script)
@@ -47,6 +56,12 @@ def write_tell(msg: str):
 # =====================================================================================
 EXPECTED_PATH = r"K:\Freqtrade"
 CONFIG_FOLDER = "user_data"
+STRATEGIES_FOLDER = os.path.join(EXPECTED_PATH, "user_data", "strategies")
+BACKTEST_RESULTS_FOLDER = os.path.join(EXPECTED_PATH, "user_data", "backtest_results")
+
+# Config keys that do not change what a backtest loads or simulates,
+# ignored when deciding whether configs can share one --strategy-list run
+BATCH_IGNORED_KEYS = ("strategy", "bot_name", "db_url", "api_server", "telegram")
 
 
 def ensure_working_directory():
@@ -120,6 +135,10 @@ def run_docker_command(
     disable_max_market_positions: bool,
     enable_position_stacking: bool,
     config_file: str,
+    strategy_list: list = None,
+    export_dir: str = None,
+    pairs: list = None,
+    timeframe: str = None,
 ):
     ensure_working_directory()
 
@@ -133,6 +152,12 @@ def run_docker_command(
     position_stacking_option = (
         ["--enable-position-stacking"] if enable_position_stacking else []
     )
+    export_option = ["--export-filename", export_dir] if export_dir else []
+    strategy_list_option = ["--strategy-list"] + strategy_list if strategy_list else []
+    pairs_option = ["--pairs"] + pairs if pairs else []
+    # --strategy-list loads every strategy on a copy of the config, so a timeframe
+    # that is only set in the strategy has to be given on the command line
+    timeframe_option = ["--timeframe", timeframe] if timeframe else []
 
     cmd = [
         "docker-compose",
@@ -150,14 +175,228 @@ def run_docker_command(
         "trades",
         "--timerange",
         timerange,
-    ] + cache_option + max_market_positions_option + position_stacking_option
+    ] + cache_option + max_market_positions_option + position_stacking_option + export_option + strategy_list_option + pairs_option + timeframe_option
 
     write_action_line("Running command: " + " ".join(cmd))
 
-    try:
-        subprocess.run(cmd, check=False)
-    except Exception as e:
-        write_error_line(f"Failed to run docker command: {e}")
+    # Backtesting runs in a single process, so one core is enough
+    with planned_cpus(container_name, 1):
+        run_recorded("backtest", cmd, container_name, config_file, timerange)
+
+
+# =====================================================================================
+# Function to choose between a single backtest and a batch of configs
+# =====================================================================================
+def select_backtest_mode() -> str:
+    while True:
+        write_action_line("Choose the backtest mode:")
+        write_warning_line("1:   Single        - One config per container.")
+        write_warning_line("2:   Batch         - Configs that only differ by strategy share one --strategy-list run.")
+        choice = input("Enter your choice: ").strip()
+
+        if choice == "1":
+            return "single"
+        elif choice == "2":
+            return "batch"
+        else:
+            write_error_line("Invalid choice. Please enter 1 or 2.")
+
+
+def select_backtest():
+    """
+    Returns a single backtest dict, or a list of them in batch mode.
+    """
+    if select_backtest_mode() == "batch":
+        return select_batch_configs()
+    return select_backtest_order()
+
+
+# =====================================================================================
+# Batch helpers
+# =====================================================================================
+def group_batch_configs(config_files: list) -> list:
+    """
+    Groups configs whose settings are identical apart from the strategy
+    (same exchange, pairlist, timeframe, stake settings, ...), so each group
+    loads its OHLCV data only once.
+    """
+    groups = {}
+    for path in config_files:
+        config_name = os.path.basename(path)
+        try:
+            config = load_json_config(path)
+        except Exception as e:
+            write_error_line(f"Skipping {config_name}: {e}")
+            continue
+
+        strategy = config.get("strategy")
+        if not strategy:
+            write_warning_line(f"Skipping {config_name}: no 'strategy' set.")
+            continue
+
+        timeframe = config.get("timeframe") or get_strategy_timeframe(strategy)
+        if not timeframe:
+            write_warning_line(f"Skipping {config_name}: no timeframe in the config or strategy.")
+            continue
+        shared = {k: v for k, v in config.items() if k not in BATCH_IGNORED_KEYS}
+        shared["timeframe"] = timeframe
+        key = json.dumps(shared, sort_keys=True)
+
+        group = groups.setdefault(
+            key,
+            {"ConfigFile": f"{CONFIG_FOLDER}/{config_name}", "Strategies": [], "Timeframe": timeframe},
+        )
+        if strategy not in group["Strategies"]:
+            group["Strategies"].append(strategy)
+
+    batch = []
+    for index, group in enumerate(groups.values(), start=1):
+        group["ContainerName"] = f"Backtest_Batch_{index}"
+        batch.append(group)
+    return batch
+
+
+def select_batch_configs():
+    ensure_working_directory()
+
+    config_folder_path = os.path.join(EXPECTED_PATH, CONFIG_FOLDER)
+    config_files = sorted(glob.glob(os.path.join(config_folder_path, "config-*.json")))
+    if not config_files:
+        write_error_line(f"No config-*.json files found in '{CONFIG_FOLDER}'.")
+        return None
+
+    while True:
+        write_action_line("Available Backtest Configs:")
+        for index, cfg in enumerate(config_files, start=1):
+            write_info_line(f"{index}. {os.path.basename(cfg)}")
+
+        choice = input(
+            "Enter the configs to batch (e.g. 1 3 4, or 'all'): "
+        ).strip().lower()
+        if choice == "all":
+            chosen = config_files
+        else:
+            numbers = choice.split()
+            if not numbers or not all(
+                n.isdigit() and 1 <= int(n) <= len(config_files) for n in numbers
+            ):
+                write_error_line(
+                    f"Invalid input. Please enter numbers between 1 and {len(config_files)} separated by spaces."
+                )
+                continue
+            chosen = [config_files[int(n) - 1] for n in dict.fromkeys(numbers)]
+
+        batch = group_batch_configs(chosen)
+        if batch:
+            return batch
+        write_error_line("None of the selected configs can be backtested.")
+
+
+def split_batch_result(export_dir: str) -> list:
+    """
+    Splits the combined --strategy-list export into one result file per
+    strategy, in the same layout freqtrade uses for single-strategy exports.
+    They go to a per_strategy sub folder without the backtest-result- prefix,
+    so Freqtrade_Result_Store.py archives only the combined result.
+    """
+    _, result = load_backtest_result(export_dir)
+    if not result:
+        write_error_line(f"No backtest result found in {export_dir}.")
+        return []
+
+    split_dir = os.path.join(export_dir, "per_strategy")
+    os.makedirs(split_dir, exist_ok=True)
+    written = []
+    for strategy, data in result.get("strategy", {}).items():
+        single = {
+            "strategy": {strategy: data},
+            "strategy_comparison": [
+                row for row in result.get("strategy_comparison", [])
+                if row.get("key") == strategy
+            ],
+        }
+        if strategy in result.get("metadata", {}):
+            single["metadata"] = {strategy: result["metadata"][strategy]}
+
+        path = os.path.join(split_dir, f"{strategy}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(single, f)
+        written.append(path)
+    return written
+
+
+# =====================================================================================
+# Batch runner
+# =====================================================================================
+def run_batch_backtest(
+    batch: list,
+    timerange: str,
+    use_cache: bool,
+    disable_max_market_positions: bool,
+    enable_position_stacking: bool,
+):
+    batch_name = f"batch_{datetime.now():%Y%m%d_%H%M%S}"
+
+    for group in batch:
+        export_name = f"{batch_name}_{group['ContainerName']}"
+        export_dir = os.path.join(BACKTEST_RESULTS_FOLDER, export_name)
+        os.makedirs(export_dir, exist_ok=True)
+
+        write_tell(
+            f"{group['ContainerName']}: {', '.join(group['Strategies'])} with {group['ConfigFile']}"
+        )
+        run_docker_command(
+            group["ContainerName"],
+            timerange,
+            use_cache,
+            disable_max_market_positions,
+            enable_position_stacking,
+            group["ConfigFile"],
+            strategy_list=group["Strategies"],
+            export_dir=f"{CONFIG_FOLDER}/backtest_results/{export_name}",
+            timeframe=group["Timeframe"],
+        )
+
+        for path in split_batch_result(export_dir):
+            write_info_line(f"Per-strategy result: {path}")
+
+
+def run_backtest(
+    backtest,
+    timerange: str,
+    use_cache: bool,
+    disable_max_market_positions: bool,
+    enable_position_stacking: bool,
+):
+    if isinstance(backtest, list):
+        run_batch_backtest(
+            backtest,
+            timerange,
+            use_cache,
+            disable_max_market_positions,
+            enable_position_stacking,
+        )
+    else:
+        run_docker_command(
+            backtest["ContainerName"],
+            timerange,
+            use_cache,
+            disable_max_market_positions,
+            enable_position_stacking,
+            backtest["ConfigFile"],
+        )
+
+
+def show_backtest(backtest):
+    if isinstance(backtest, list):
+        for group in backtest:
+            write_info_line(f"Selected Container: {group['ContainerName']}")
+            write_info_line(f"Config File: {group['ConfigFile']}")
+            write_info_line(f"Strategies: {', '.join(group['Strategies'])}")
+            write_info_line(f"Timeframe: {group['Timeframe']}")
+    else:
+        write_info_line(f"Selected Container: {backtest['ContainerName']}")
+        write_info_line(f"Config File: {backtest['ConfigFile']}")
 
 
 # =====================================================================================
@@ -166,14 +405,11 @@ def run_docker_command(
 def main():
     ensure_working_directory()
 
-    backtest = select_backtest_order()
+    backtest = select_backtest()
     if not backtest:
         write_error_line("No backtest option selected. Exiting...")
         return
 
-    container_name = backtest["ContainerName"]
-    config_file = backtest["ConfigFile"]
-
     timerange = DEFAULT_TIMERANGE
     use_cache = DEFAULT_USE_CACHE
 
@@ -181,17 +417,15 @@ def main():
     disable_max_market_positions = False
     enable_position_stacking = False
 
-    write_info_line(f"Selected Container: {container_name}")
-    write_info_line(f"Config File: {config_file}")
+    show_backtest(backtest)
 
     # Initial run
-    run_docker_command(
-        container_name,
+    run_backtest(
+        backtest,
         timerange,
         use_cache,
         disable_max_market_positions,
         enable_position_stacking,
-        config_file,
     )
 
     # User input loop
@@ -209,40 +443,35 @@ def main():
 
         if user_input == "r":
             write_tell("Retrying with the same parameters...")
-            run_docker_command(
-                container_name,
+            run_backtest(
+                backtest,
                 timerange,
                 use_cache,
                 disable_max_market_positions,
                 enable_position_stacking,
-                config_file,
             )
 
         elif user_input == "n":
-            backtest = select_backtest_order()
+            backtest = select_backtest()
             if not backtest:
                 write_error_line("No backtest option selected. Exiting...")
                 return
 
-            container_name = backtest["ContainerName"]
-            config_file = backtest["ConfigFile"]
             timerange = DEFAULT_TIMERANGE
             use_cache = DEFAULT_USE_CACHE
             # still keep the toggles "off" unless you want to add prompts later
             disable_max_market_positions = False
             enable_position_stacking = False
 
-            write_info_line(f"Selected Container: {container_name}")
-            write_info_line(f"Config File: {config_file}")
+            show_backtest(backtest)
 
             write_warning_line("Running command with selected parameters...")
-            run_docker_command(
-                container_name,
+            run_backtest(
+                backtest,
                 timerange,
                 use_cache,
                 disable_max_market_positions,
                 enable_position_stacking,
-                config_file,
             )
 
         elif user_input == "e":
@@ -0,0 +1,406 @@
+#!/usr/bin/env python
+import os
+import glob
+import json
+import subprocess
+import threading
+import time
+from contextlib import contextmanager
+
+# =====================================================================================
+# Basic colored output (works in modern Windows terminals with ANSI support)
+# =====================================================================================
+RESET = "\033[0m"
+RED = "\033[31m"
+WHITE = "\033[37m"
+YELLOW = "\033[33m"
+GREEN = "\033[32m"
+BLUE = "\033[34m"
+
+
+def write_error_line(msg: str):
+    print(f"{RED}{msg}{RESET}")
+
+
+def write_info_line(msg: str):
+    print(f"{WHITE}{msg}{RESET}")
+
+
+def write_warning_line(msg: str):
+    print(f"{YELLOW}{msg}{RESET}")
+
+
+def write_action_line(msg: str):
+    print(f"{GREEN}{msg}{RESET}")
+
+
+def write_tell(msg: str):
+    print(f"{BLUE}{msg}{RESET}")
+
+
+# =====================================================================================
+# Config / path constants
+# =====================================================================================
+PROJECT_ROOT = r"K:\Freqtrade"
+PLAN_FILE = os.path.join(PROJECT_ROOT, "user_data", "cpu_plan.json")
+LOCK_FILE = PLAN_FILE + ".lock"
+
+# Set to False to let containers compete for all cores like before. To compare
+# throughput, run the same hyperopt/backtests with either setting and compare
+# the wall times with 'compare' in Freqtrade_Run_History.py.
+CPU_PLANNER_ENABLED = True
+
+# CPUs as seen by the Docker engine, per NUMA node. None = detect automatically.
+# Example for a dual-socket 32 core host: {0: list(range(0, 16)), 1: list(range(16, 32))}
+NUMA_NODES = None
+
+# Cores kept free for the OS / Docker itself
+RESERVED_CPUS = 0
+
+POLL_SECONDS = 5
+LOCK_STALE_SECONDS = 30
+# An allocation whose container is not running is kept this long, so a container
+# that is still starting up does not lose its cores
+STARTUP_GRACE_SECONDS = 300
+PIN_TIMEOUT_SECONDS = 300
+
+
+# =====================================================================================
+# CPU topology
+# =====================================================================================
+def parse_cpulist(cpulist: str) -> list:
+    """
+    Parses the kernel cpulist format, e.g. "0-3,8-11" -> [0, 1, 2, 3, 8, 9, 10, 11].
+    """
+    cpus = []
+    for part in cpulist.strip().split(","):
+        if not part:
+            continue
+        if "-" in part:
+            first, last = part.split("-")
+            cpus.extend(range(int(first), int(last) + 1))
+        else:
+            cpus.append(int(part))
+    return cpus
+
+
+def format_cpulist(cpus: list) -> str:
+    """
+    Formats CPUs for --cpuset-cpus, e.g. [0, 1, 2, 3, 8] -> "0-3,8".
+    """
+    ranges = []
+    for cpu in sorted(cpus):
+        if ranges and cpu == ranges[-1][1] + 1:
+            ranges[-1][1] = cpu
+        else:
+            ranges.append([cpu, cpu])
+    return ",".join(f"{a}-{b}" if a != b else f"{a}" for a, b in ranges)
+
+
+def get_cpu_topology() -> dict:
+    if NUMA_NODES:
+        return {int(node): list(cpus) for node, cpus in NUMA_NODES.items()}
+
+    topology = {}
+    for path in sorted(glob.glob("/sys/devices/system/node/node[0-9]*/cpulist")):
+        node = int(os.path.basename(os.path.dirname(path))[4:])
+        with open(path, "r", encoding="utf-8") as f:
+            cpus = parse_cpulist(f.read())
+        if cpus:
+            topology[node] = cpus
+    if topology:
+        return topology
+
+    # Docker Desktop runs the engine in a VM, so ask the engine how many CPUs it has
+    try:
+        ncpu = int(
+            subprocess.run(
+                ["docker", "info", "--format", "{{.NCPU}}"],
+                capture_output=True,
+                text=True,
+                check=False,
+            ).stdout.strip()
+        )
+    except Exception:
+        ncpu = os.cpu_count() or 1
+    return {0: list(range(ncpu))}
+
+
+# =====================================================================================
+# Shared plan file (one per machine, used by every launcher script)
+# =====================================================================================
+@contextmanager
+def plan_lock():
+    while True:
+        try:
+            fd = os.open(LOCK_FILE, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                if time.time() - os.path.getmtime(LOCK_FILE) > LOCK_STALE_SECONDS:
+                    os.remove(LOCK_FILE)
+                    continue
+            except OSError:
+                continue
+            time.sleep(0.2)
+    try:
+        yield
+    finally:
+        os.close(fd)
+        try:
+            os.remove(LOCK_FILE)
+        except OSError:
+            pass
+
+
+def load_plan() -> dict:
+    try:
+        with open(PLAN_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_plan(plan: dict):
+    tmp = PLAN_FILE + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(plan, f, indent=4)
+    os.replace(tmp, PLAN_FILE)
+
+
+def get_running_containers():
+    try:
+        out = subprocess.run(
+            ["docker", "ps", "--format", "{{.Names}}"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+    except Exception:
+        return None
+    return set(out.split())
+
+
+def prune_plan(plan: dict) -> dict:
+    """
+    Drops allocations whose container has exited, so their cores go back to the pool.
+    """
+    running = get_running_containers()
+    if running is None:
+        return plan
+    now = time.time()
+    return {
+        name: allocation
+        for name, allocation in plan.items()
+        if name in running or now - allocation["allocated_at"] < STARTUP_GRACE_SECONDS
+    }
+
+
+def choose_cpus(topology: dict, used: set, wanted: int):
+    """
+    Picks `wanted` free CPUs, preferring a single NUMA node so the container's
+    memory can be bound to it. Returns (cpus, mems); mems is None when the
+    CPUs span several nodes or the host has a single node.
+    """
+    free = {
+        node: [cpu for cpu in cpus if cpu not in used]
+        for node, cpus in topology.items()
+    }
+    nodes = sorted(free, key=lambda node: len(free[node]), reverse=True)
+
+    for node in nodes:
+        if len(free[node]) >= wanted:
+            mems = str(node) if len(topology) > 1 else None
+            return free[node][:wanted], mems
+
+    cpus = []
+    for node in nodes:
+        cpus.extend(free[node][: wanted - len(cpus)])
+    return cpus, None
+
+
+def acquire_cpus(container_name: str, wanted: int):
+    """
+    Reserves up to `wanted` cores for the container. Waits until at least one
+    core is free; gets fewer than `wanted` when the host is busy (rebalance_cpus
+    widens it later). While waiting, the launcher is listed in the plan so freed
+    cores go to it first.
+    """
+    topology = get_cpu_topology()
+    all_cpus = sorted(cpu for cpus in topology.values() for cpu in cpus)
+    reserved = set(all_cpus[:RESERVED_CPUS])
+    waiting = False
+
+    while True:
+        with plan_lock():
+            plan = prune_plan(load_plan())
+            plan.pop(container_name, None)
+            used = reserved | {cpu for a in plan.values() for cpu in a["cpus"]}
+            available = len(all_cpus) - len(used)
+
+            if available > 0:
+                cpus, mems = choose_cpus(topology, used, min(wanted, available))
+                plan[container_name] = {
+                    "cpus": cpus,
+                    "mems": mems,
+                    "wanted": wanted,
+                    "allocated_at": time.time(),
+                }
+                save_plan(plan)
+                return cpus, mems
+
+            plan[container_name] = {
+                "cpus": [],
+                "mems": None,
+                "wanted": wanted,
+                "allocated_at": time.time(),
+                "waiting": True,
+            }
+            save_plan(plan)
+
+        if not waiting:
+            write_warning_line(
+                "All cores are assigned to running containers. Waiting for one to exit..."
+            )
+            waiting = True
+        time.sleep(POLL_SECONDS)
+
+
+def release_cpus(container_name: str):
+    with plan_lock():
+        plan = load_plan()
+        if plan.pop(container_name, None) is not None:
+            save_plan(plan)
+    rebalance_cpus()
+
+
+def rebalance_cpus():
+    """
+    Gives free cores to running containers that got fewer than they asked for,
+    widening their cpuset with `docker update`. Skipped while a launcher is
+    waiting, so a new container is never starved by ones that already run.
+    Containers that were pinned to a memory node only grow within that node.
+    """
+    topology = get_cpu_topology()
+    all_cpus = sorted(cpu for cpus in topology.values() for cpu in cpus)
+    reserved = set(all_cpus[:RESERVED_CPUS])
+
+    widened = []
+    with plan_lock():
+        plan = prune_plan(load_plan())
+        running = get_running_containers()
+        if running is None or any(a.get("waiting") for a in plan.values()):
+            return
+        used = reserved | {cpu for a in plan.values() for cpu in a["cpus"]}
+
+        for name, allocation in plan.items():
+            missing = allocation.get("wanted", 0) - len(allocation["cpus"])
+            if missing <= 0 or name not in running:
+                continue
+            candidates = topology[int(allocation["mems"])] if allocation["mems"] is not None else all_cpus
+            extra = [cpu for cpu in candidates if cpu not in used][:missing]
+            if not extra:
+                continue
+            allocation["cpus"] = sorted(allocation["cpus"] + extra)
+            used |= set(extra)
+            widened.append((name, allocation["cpus"]))
+
+        if widened:
+            save_plan(plan)
+
+    for name, cpus in widened:
+        result = subprocess.run(
+            ["docker", "update", "--cpuset-cpus", format_cpulist(cpus), name],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        if result.returncode == 0:
+            write_tell(f"{name}: widened to cores {format_cpulist(cpus)}")
+
+
+def pin_container(container_name: str, cpus: list, mems, stop_event: threading.Event):
+    """
+    Applies the cpuset as soon as the container exists. `docker-compose run`
+    has no --cpuset-cpus option, so this uses `docker update` on the new container.
+    Stops when stop_event is set, so a container that never started is not
+    pinned later, after its cores were handed to someone else.
+    """
+    cmd = ["docker", "update", "--cpuset-cpus", format_cpulist(cpus)]
+    if mems is not None:
+        cmd += ["--cpuset-mems", mems]
+    cmd.append(container_name)
+
+    deadline = time.time() + PIN_TIMEOUT_SECONDS
+    while time.time() < deadline and not stop_event.is_set():
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+        except Exception as e:
+            write_error_line(f"Failed to pin {container_name}: {e}")
+            return
+        if result.returncode == 0:
+            return
+        stop_event.wait(0.5)
+    if stop_event.is_set():
+        return
+    write_warning_line(f"Could not pin {container_name} to its cores; it ran unpinned.")
+
+
+@contextmanager
+def planned_cpus(container_name: str, wanted: int):
+    """
+    Reserves cores for the container for the duration of the block, pins the
+    container to them once it starts, and frees them afterwards. Yields the
+    assigned CPUs, or None when the planner is disabled.
+    """
+    if not CPU_PLANNER_ENABLED:
+        yield None
+        return
+
+    cpus, mems = acquire_cpus(container_name, wanted)
+    node = f", memory node {mems}" if mems is not None else ""
+    write_tell(f"{container_name}: cores {format_cpulist(cpus)}{node}")
+
+    stop_pinning = threading.Event()
+    pinner = threading.Thread(
+        target=pin_container, args=(container_name, cpus, mems, stop_pinning), daemon=True
+    )
+    pinner.start()
+    try:
+        yield cpus
+    finally:
+        stop_pinning.set()
+        pinner.join()
+        release_cpus(container_name)
+
+
+# =====================================================================================
+# Main flow (shows the topology and the current plan)
+# =====================================================================================
+def main():
+    topology = get_cpu_topology()
+    write_action_line("CPU topology:")
+    for node, cpus in topology.items():
+        write_info_line(f"Node {node}: {format_cpulist(cpus)}")
+
+    with plan_lock():
+        plan = prune_plan(load_plan())
+        save_plan(plan)
+
+    if not plan:
+        write_tell("No cores assigned to containers.")
+        return
+
+    write_action_line("Assigned cores:")
+    for name, allocation in plan.items():
+        if allocation.get("waiting"):
+            write_warning_line(f"{name}: waiting for {allocation['wanted']} core(s)")
+            continue
+        node = f" (memory node {allocation['mems']})" if allocation["mems"] is not None else ""
+        wanted = allocation.get("wanted", len(allocation["cpus"]))
+        short = f", asked for {wanted}" if wanted > len(allocation["cpus"]) else ""
+        write_info_line(f"{name}: {format_cpulist(allocation['cpus'])}{node}{short}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,497 @@
+#!/usr/bin/env python
+import os
+import re
+import glob
+import json
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+
+try:
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:
+    np = None
+
+from Freqtrade_Run_History import run_recorded
+
+# =====================================================================================
+# Basic colored output (works in modern Windows terminals with ANSI support)
+# =====================================================================================
+RESET = "\033[0m"
+RED = "\033[31m"
+WHITE = "\033[37m"
+YELLOW = "\033[33m"
+GREEN = "\033[32m"
+BLUE = "\033[34m"
+
+
+def write_error_line(msg: str):
+    print(f"{RED}{msg}{RESET}")
+
+
+def write_info_line(msg: str):
+    print(f"{WHITE}{msg}{RESET}")
+
+
+def write_warning_line(msg: str):
+    print(f"{YELLOW}{msg}{RESET}")
+
+
+def write_action_line(msg: str):
+    print(f"{GREEN}{msg}{RESET}")
+
+
+def write_tell(msg: str):
+    print(f"{BLUE}{msg}{RESET}")
+
+
+# =====================================================================================
+# Config / path constants
+# =====================================================================================
+PROJECT_ROOT = r"K:\Freqtrade"
+EXCHANGE = "kucoin"
+DATA_FOLDER = os.path.join(PROJECT_ROOT, "user_data", "data", EXCHANGE)
+REPORT_FILE = os.path.join(PROJECT_ROOT, "user_data", "data", "integrity_report.json")
+# Gaps that were re-downloaded once and are still missing (not available on the exchange)
+KNOWN_GAPS_FILE = os.path.join(PROJECT_ROOT, "user_data", "data", "integrity_known_gaps.json")
+# Gap windows are downloaded here and merged into the real files afterwards
+REPAIR_FOLDER = os.path.join(PROJECT_ROOT, "user_data", "data", "_repair")
+DOWNLOAD_CONFIG = "user_data/config-1.json"
+
+# Zero-volume candles are normal on quiet pairs; only report longer runs
+ZERO_VOLUME_MIN_RUN = 12
+# Gap ranges kept per file in the report (the totals always cover all gaps)
+MAX_GAPS_PER_FILE = 20
+# Gaps of one file that are closer than this are re-downloaded in one timerange
+GAP_MERGE_DAYS = 3
+DAY_MS = 86_400_000
+
+TIMEFRAME_MS = {"m": 60_000, "h": 3_600_000, "d": 86_400_000, "w": 604_800_000}
+FILE_PATTERN = re.compile(r"^(?P<pair>.+)-(?P<timeframe>\d+[mhdw])(?:-(?P<candle_type>\w+))?\.feather$")
+
+
+def ensure_working_directory():
+    if os.getcwd().lower() != PROJECT_ROOT.lower():
+        write_warning_line(f"Switching to expected working directory: {PROJECT_ROOT}")
+        try:
+            os.chdir(PROJECT_ROOT)
+        except Exception as e:
+            write_error_line(f"Failed to change directory to {PROJECT_ROOT}. {e}")
+            sys.exit(1)
+
+
+# =====================================================================================
+# File name helpers
+# =====================================================================================
+def parse_data_file(path: str):
+    """
+    BTC_USDT-5m.feather -> ("BTC/USDT", "5m", "spot")
+    BTC_USDT_USDT-1h-futures.feather -> ("BTC/USDT:USDT", "1h", "futures")
+    """
+    m = FILE_PATTERN.match(os.path.basename(path))
+    if not m:
+        return None
+    parts = m.group("pair").split("_")
+    if len(parts) == 3:
+        pair = f"{parts[0]}/{parts[1]}:{parts[2]}"
+    elif len(parts) == 2:
+        pair = f"{parts[0]}/{parts[1]}"
+    else:
+        pair = m.group("pair")
+    return pair, m.group("timeframe"), m.group("candle_type") or "spot"
+
+
+def timeframe_to_ms(timeframe: str) -> int:
+    return int(timeframe[:-1]) * TIMEFRAME_MS[timeframe[-1]]
+
+
+def format_ms(ms: int) -> str:
+    return datetime.fromtimestamp(ms / 1000, tz=timezone.utc).strftime("%Y-%m-%d %H:%M")
+
+
+def read_dates_ms(table):
+    """
+    Returns the date column as int64 milliseconds, whatever unit it was stored in.
+    """
+    column = table.column("date").combine_chunks()
+    unit = getattr(column.type, "unit", "ms")
+    dates = column.cast(pa.int64()).to_numpy(zero_copy_only=False)
+    if unit == "s":
+        return dates * 1000
+    return dates // {"ms": 1, "us": 1_000, "ns": 1_000_000}[unit]
+
+
+def find_gaps(unique_dates, tf_ms: int) -> list:
+    """
+    Returns [first missing candle, last missing candle] (ms) for every gap in
+    sorted, de-duplicated candle dates.
+    """
+    steps = np.diff(unique_dates)
+    return [
+        [int(unique_dates[i] + tf_ms), int(unique_dates[i + 1] - tf_ms)]
+        for i in np.flatnonzero(steps > tf_ms)
+    ]
+
+
+def count_candles(gaps: list, tf_ms: int) -> int:
+    return sum((end - start) // tf_ms + 1 for start, end in gaps)
+
+
+def load_known_gaps() -> dict:
+    try:
+        with open(KNOWN_GAPS_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_known_gaps(known_gaps: dict):
+    with open(KNOWN_GAPS_FILE, "w", encoding="utf-8") as f:
+        json.dump(known_gaps, f, separators=(",", ":"))
+
+
+def get_data_key(path: str) -> str:
+    return os.path.relpath(path, DATA_FOLDER).replace(os.sep, "/")
+
+
+# =====================================================================================
+# Scanner (runs in worker processes)
+# =====================================================================================
+def scan_file(path: str, known_gaps: list = ()) -> dict:
+    parsed = parse_data_file(path)
+    report = {"file": os.path.basename(path), "path": path}
+    if not parsed:
+        report["error"] = "unrecognised file name"
+        return report
+    report["pair"], report["timeframe"], report["candle_type"] = parsed
+    tf_ms = timeframe_to_ms(parsed[1])
+
+    try:
+        table = feather.read_table(path, columns=["date", "volume"], memory_map=True)
+    except Exception as e:
+        report["error"] = str(e)
+        return report
+
+    report["rows"] = table.num_rows
+    if table.num_rows == 0:
+        return report
+
+    dates = read_dates_ms(table)
+    volume = table.column("volume").combine_chunks().to_numpy(zero_copy_only=False)
+    report["start"] = format_ms(int(dates.min()))
+    report["end"] = format_ms(int(dates.max()))
+
+    diffs = np.diff(dates)
+    report["out_of_order"] = int(np.count_nonzero(diffs < 0))
+
+    ordered = np.sort(dates)
+    report["duplicates"] = int(np.count_nonzero(np.diff(ordered) == 0))
+
+    unique = np.unique(ordered)
+    report["misaligned"] = int(np.count_nonzero(unique % tf_ms))
+    known = {tuple(gap) for gap in known_gaps}
+    gaps = find_gaps(unique, tf_ms)
+    exchange_gaps = [gap for gap in gaps if tuple(gap) in known]
+    gaps = [gap for gap in gaps if tuple(gap) not in known]
+    report["missing_candles"] = count_candles(gaps, tf_ms)
+    report["gaps"] = [[format_ms(start), format_ms(end)] for start, end in gaps[:MAX_GAPS_PER_FILE]]
+    report["gap_count"] = len(gaps)
+    # Already re-downloaded once without result; not counted as an issue
+    report["exchange_gap_candles"] = count_candles(exchange_gaps, tf_ms)
+
+    # Runs of zero volume: find where the zero/non-zero flag changes
+    zero = np.concatenate(([0], (volume == 0).astype(np.int8), [0]))
+    edges = np.flatnonzero(np.diff(zero))
+    run_lengths = edges[1::2] - edges[0::2]
+    long_runs = run_lengths[run_lengths >= ZERO_VOLUME_MIN_RUN]
+    report["zero_volume_runs"] = int(long_runs.size)
+    report["longest_zero_volume_run"] = int(run_lengths.max()) if run_lengths.size else 0
+    return report
+
+
+def has_issues(report: dict) -> bool:
+    return bool(
+        report.get("error")
+        or report.get("out_of_order")
+        or report.get("duplicates")
+        or report.get("misaligned")
+        or report.get("missing_candles")
+        or report.get("zero_volume_runs")
+    )
+
+
+def scan_data_folder(data_folder: str) -> list:
+    files = sorted(glob.glob(os.path.join(data_folder, "**", "*.feather"), recursive=True))
+    if not files:
+        write_error_line(f"No .feather files found in {data_folder}.")
+        return []
+
+    known_gaps = load_known_gaps()
+    write_action_line(f"Scanning {len(files)} file(s) on {os.cpu_count()} core(s)...")
+    started = time.time()
+    with ProcessPoolExecutor() as pool:
+        reports = list(
+            pool.map(
+                scan_file,
+                files,
+                [known_gaps.get(get_data_key(path), []) for path in files],
+                chunksize=max(1, len(files) // (4 * (os.cpu_count() or 1))),
+            )
+        )
+    write_tell(f"Scanned {len(files)} file(s) in {time.time() - started:.1f}s.")
+    return reports
+
+
+def write_report(reports: list):
+    issues = [r for r in reports if has_issues(r)]
+    summary = {
+        "files": len(reports),
+        "files_with_issues": len(issues),
+        "errors": sum(1 for r in reports if r.get("error")),
+        "out_of_order": sum(r.get("out_of_order", 0) for r in reports),
+        "duplicates": sum(r.get("duplicates", 0) for r in reports),
+        "misaligned": sum(r.get("misaligned", 0) for r in reports),
+        "missing_candles": sum(r.get("missing_candles", 0) for r in reports),
+        "exchange_gap_candles": sum(r.get("exchange_gap_candles", 0) for r in reports),
+        "zero_volume_runs": sum(r.get("zero_volume_runs", 0) for r in reports),
+    }
+    with open(REPORT_FILE, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "scanned_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "summary": summary,
+                "issues": [{k: v for k, v in r.items() if k != "path"} for r in issues],
+            },
+            f,
+            separators=(",", ":"),
+        )
+
+    for key, value in summary.items():
+        line = f"{key:<20} {value}"
+        if value and key not in ("files", "exchange_gap_candles"):
+            write_warning_line(line)
+        else:
+            write_info_line(line)
+    for r in issues[:20]:
+        write_info_line(
+            f"{r['file']}: "
+            + ", ".join(
+                f"{k}={r[k]}"
+                for k in ("error", "out_of_order", "duplicates", "misaligned", "missing_candles", "zero_volume_runs")
+                if r.get(k)
+            )
+        )
+    if len(issues) > 20:
+        write_info_line(f"... and {len(issues) - 20} more file(s)")
+    write_tell(f"Report written to {REPORT_FILE}")
+
+
+# =====================================================================================
+# Repair
+# =====================================================================================
+def write_table_atomic(table, path: str):
+    tmp = path + ".tmp"
+    feather.write_feather(table, tmp, compression="lz4")
+    os.replace(tmp, path)
+
+
+def deduplicate_file(path: str) -> int:
+    """
+    Sorts the file by date and drops duplicate timestamps (keeping the last
+    row, as freqtrade does when it merges new candles). Returns rows removed.
+    """
+    table = feather.read_table(path)
+    dates = read_dates_ms(table)
+    order = np.argsort(dates, kind="stable")
+    ordered = dates[order]
+    keep = np.append(ordered[1:] != ordered[:-1], True)
+    repaired = table.take(pa.array(order[keep]))
+    write_table_atomic(repaired, path)
+    return table.num_rows - repaired.num_rows
+
+
+def gap_timeranges(gaps: list) -> list:
+    """
+    Turns gaps into freqtrade timeranges (whole days), joining gaps that are
+    less than GAP_MERGE_DAYS apart.
+    """
+    windows = []
+    for start, end in sorted(gaps):
+        start_day = start // DAY_MS * DAY_MS
+        end_day = (end // DAY_MS + 1) * DAY_MS
+        if windows and start_day <= windows[-1][1] + GAP_MERGE_DAYS * DAY_MS:
+            windows[-1][1] = max(windows[-1][1], end_day)
+        else:
+            windows.append([start_day, end_day])
+    return [
+        f"{datetime.fromtimestamp(s / 1000, tz=timezone.utc):%Y%m%d}-"
+        f"{datetime.fromtimestamp(e / 1000, tz=timezone.utc):%Y%m%d}"
+        for s, e in windows
+    ]
+
+
+def merge_missing_candles(path: str, downloaded_path: str) -> int:
+    """
+    Adds the candles of downloaded_path that path does not have yet. Existing
+    candles are never replaced. Returns rows added.
+    """
+    table = feather.read_table(path)
+    downloaded = feather.read_table(downloaded_path).select(table.column_names).cast(table.schema)
+    merged = pa.concat_tables([table, downloaded])
+    dates = read_dates_ms(merged)
+    # Stable sort keeps the existing row first when a date is in both
+    order = np.argsort(dates, kind="stable")
+    ordered = dates[order]
+    keep = np.insert(ordered[1:] != ordered[:-1], 0, True)
+    repaired = merged.take(pa.array(order[keep]))
+    write_table_atomic(repaired, path)
+    return repaired.num_rows - table.num_rows
+
+
+def download_gap_windows(windows: dict):
+    """
+    Downloads each (timeframe, candle_type, timerange) window for its pairs into
+    REPAIR_FOLDER, so the real data files are only touched by the merge.
+    """
+    for (timeframe, candle_type, timerange), pairs in sorted(windows.items()):
+        trading_mode = ["--trading-mode", "futures"] if candle_type != "spot" else []
+        cmd = [
+            "docker-compose",
+            "run",
+            "--name",
+            "DataRepair",
+            "--rm",
+            "freqtrade",
+            "download-data",
+            "--exchange",
+            EXCHANGE,
+            "--config",
+            DOWNLOAD_CONFIG,
+            "--datadir",
+            "user_data/data/_repair",
+            "--data-format-ohlcv",
+            "feather",
+        ] + trading_mode + [
+            "--timerange",
+            timerange,
+            "--timeframes",
+            timeframe,
+            "--pairs",
+        ] + sorted(pairs)
+
+        write_action_line("Running command: " + " ".join(cmd))
+        run_recorded("download", cmd, "DataRepair", DOWNLOAD_CONFIG, timerange)
+
+
+def get_yes_no(prompt: str) -> bool:
+    while True:
+        write_warning_line(f"{prompt} (Yes/No)")
+        choice = input().strip().lower()
+        if choice in ("y", "yes"):
+            return True
+        elif choice in ("n", "no"):
+            return False
+        write_error_line("Invalid input. Please enter 'Yes' or 'No'.")
+
+
+def repair(reports: list):
+    ensure_working_directory()
+
+    unordered = [r for r in reports if r.get("duplicates") or r.get("out_of_order")]
+    for r in unordered:
+        removed = deduplicate_file(r["path"])
+        write_info_line(f"{r['file']}: sorted, {removed} duplicate row(s) removed")
+
+    gapped = [r for r in reports if r.get("gap_count")]
+    if not gapped:
+        write_tell("No gaps to re-download.")
+        return
+
+    known_gaps = load_known_gaps()
+    requested = {}
+    windows = {}
+    for r in gapped:
+        tf_ms = timeframe_to_ms(r["timeframe"])
+        dates = read_dates_ms(feather.read_table(r["path"], columns=["date"], memory_map=True))
+        known = {tuple(gap) for gap in known_gaps.get(get_data_key(r["path"]), [])}
+        gaps = [gap for gap in find_gaps(np.unique(dates), tf_ms) if tuple(gap) not in known]
+        requested[r["path"]] = gaps
+        for timerange in gap_timeranges(gaps):
+            windows.setdefault((r["timeframe"], r["candle_type"], timerange), set()).add(r["pair"])
+
+    write_warning_line(
+        f"{len(gapped)} file(s) have gaps. Only the gap windows are re-downloaded "
+        f"({len(windows)} download(s)) and merged in; existing candles are kept."
+    )
+    if not get_yes_no("Re-download the missing candles?"):
+        return
+
+    shutil.rmtree(REPAIR_FOLDER, ignore_errors=True)
+    download_gap_windows(windows)
+
+    downloaded = {}
+    for path in glob.glob(os.path.join(REPAIR_FOLDER, "**", "*.feather"), recursive=True):
+        downloaded[os.path.basename(path)] = path
+
+    for r in gapped:
+        source = downloaded.get(r["file"])
+        added = merge_missing_candles(r["path"], source) if source else 0
+
+        # Whatever is still missing is not available on the exchange; remember it
+        tf_ms = timeframe_to_ms(r["timeframe"])
+        dates = read_dates_ms(feather.read_table(r["path"], columns=["date"], memory_map=True))
+        remaining = {tuple(gap) for gap in find_gaps(np.unique(dates), tf_ms)}
+        still_missing = [gap for gap in requested[r["path"]] if tuple(gap) in remaining]
+        if still_missing:
+            key = get_data_key(r["path"])
+            known_gaps[key] = known_gaps.get(key, []) + still_missing
+        write_info_line(
+            f"{r['file']}: {added} candle(s) added, "
+            f"{count_candles(still_missing, tf_ms)} not available on the exchange"
+        )
+
+    save_known_gaps(known_gaps)
+    shutil.rmtree(REPAIR_FOLDER, ignore_errors=True)
+
+
+# =====================================================================================
+# Main flow
+# =====================================================================================
+def main():
+    if np is None:
+        write_error_line("This script needs numpy and pyarrow: pip install numpy pyarrow")
+        sys.exit(1)
+
+    ensure_working_directory()
+
+    reports = scan_data_folder(DATA_FOLDER)
+    if reports:
+        write_report(reports)
+
+    while True:
+        write_action_line("Type 'repair' (r), 'scan' (s) to scan again, or 'exit' (e)")
+        user_input = input().strip().lower()
+
+        if user_input in ("repair", "r"):
+            repair(reports)
+            write_tell("Scanning again after repair...")
+            reports = scan_data_folder(DATA_FOLDER)
+            if reports:
+                write_report(reports)
+        elif user_input in ("scan", "s"):
+            reports = scan_data_folder(DATA_FOLDER)
+            if reports:
+                write_report(reports)
+        elif user_input in ("exit", "e"):
+            write_info_line("Exiting...")
+            break
+        else:
+            write_error_line("Invalid input. Please type 'repair', 'scan' or 'exit'.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,11 @@
 #!/usr/bin/env python
 import os
 import re
-import subprocess
 import sys
+import json
+import time
+
+from Freqtrade_Run_History import run_recorded
 
 # ==============================
 # Default parameters
@@ -12,6 +15,8 @@ DEFAULT_TIMEFRAMES = "1m 5m 15m 1h"
 DEFAULT_INCLUDE_INACTIVE_PAIRS = False
 
 EXPECTED_PATH = r"K:\Freqtrade"
+# Per-pair/timeframe progress of the running download, read by Freqtrade_Stream_Pipeline.py
+DOWNLOAD_STATUS_FILE = os.path.join(EXPECTED_PATH, "user_data", "data", "download_status.json")
 
 # ==============================
 # Colored output helpers
@@ -152,13 +157,84 @@ def get_include_inactive_pairs() -> bool:
             write_error_line("Invalid input. Please enter 'Yes' or 'No'.")
 
 
+# ==============================
+# Download status
+# ==============================
+class DownloadStatus:
+    """
+    Follows the download-data log and publishes which pairs/timeframes are done.
+    freqtrade downloads one pair/timeframe at a time and logs
+    'Download history data for "<pair>", <timeframe>, <candle type> ...' when it
+    starts one, so the previous one is complete when the next line appears and
+    the last one when the container exits cleanly.
+    """
+
+    LINE_PATTERN = re.compile(r'Download history data for "([^"]+)", (\w+), (\w+)')
+    # Funding rate / mark candles are downloaded too in futures mode, they are not OHLCV data
+    OHLCV_CANDLE_TYPES = ("spot", "futures")
+
+    def __init__(self, timerange: str, timeframes: list):
+        self.status = {
+            "started_at": time.time(),
+            "timerange": timerange,
+            "timeframes": timeframes,
+            "finished": False,
+            "exit_code": None,
+            "completed": {},
+        }
+        self.current = None
+        self.write()
+
+    def write(self):
+        os.makedirs(os.path.dirname(DOWNLOAD_STATUS_FILE), exist_ok=True)
+        tmp_path = DOWNLOAD_STATUS_FILE + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.status, f, indent=2)
+        os.replace(tmp_path, DOWNLOAD_STATUS_FILE)
+
+    def complete_current(self):
+        if self.current:
+            pair, timeframe = self.current
+            timeframes = self.status["completed"].setdefault(pair, [])
+            if timeframe not in timeframes:
+                timeframes.append(timeframe)
+            self.current = None
+            self.write()
+
+    def __call__(self, line: str):
+        m = self.LINE_PATTERN.search(line)
+        if not m:
+            return
+        self.complete_current()
+        pair, timeframe, candle_type = m.groups()
+        if candle_type in self.OHLCV_CANDLE_TYPES:
+            self.current = (pair, timeframe)
+
+    def finish(self, exit_code):
+        if exit_code == 0:
+            self.complete_current()
+        self.status["finished"] = True
+        self.status["exit_code"] = exit_code
+        self.write()
+
+
+def read_download_status():
+    try:
+        with open(DOWNLOAD_STATUS_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
 # ==============================
 # Run Docker command
 # ==============================
-def run_docker_command(timerange: str, timeframes: str, include_inactive_pairs: bool):
+def run_docker_command(timerange: str, timeframes: str, include_inactive_pairs: bool, pairs: list = None):
     ensure_working_directory()
 
     inactive_flag = ["--include-inactive-pairs"] if include_inactive_pairs else []
+    # Overrides the whitelist of config-1.json (used by the stream pipeline)
+    pairs_args = ["--pairs"] + pairs if pairs else []
 
     timeframes_list = [t for t in timeframes.split(" ") if t]
 
@@ -176,7 +252,7 @@ def run_docker_command(timerange: str, timeframes: str, include_inactive_pairs:
         "user_data/config-1.json",
         "--data-format-ohlcv",
         "feather",
-    ] + inactive_flag + [
+    ] + inactive_flag + pairs_args + [
         "--prepend",
         "--timerange",
         timerange,
@@ -185,10 +261,17 @@ def run_docker_command(timerange: str, timeframes: str, include_inactive_pairs:
 
     write_action_line("Running command: " + " ".join(cmd))
 
-    try:
-        subprocess.run(cmd, check=False)
-    except Exception as e:
-        write_error_line(f"Failed to run docker command: {e}")
+    status = DownloadStatus(timerange, timeframes_list)
+    run_recorded(
+        "download",
+        cmd,
+        "DataDownload",
+        "user_data/config-1.json",
+        timerange,
+        on_output=status,
+        on_exit=status.finish,
+    )
+    return status.status.get("exit_code")
 
 
 # ==============================
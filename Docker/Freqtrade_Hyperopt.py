@@ -2,8 +2,24 @@
 import os
 import re
 import glob
-import subprocess
+import ast
+import json
+import math
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from Freqtrade_Cpu_Planner import planned_cpus
+from Freqtrade_Result_Store import load_archived_hyperopt_epochs
+from Freqtrade_Run_History import (
+    find_strategy_file,
+    get_epoch_parameters,
+    get_strategy_timeframe,
+    load_backtest_result,
+    load_hyperopt_epochs,
+    load_json_config,
+    run_recorded,
+)
 
 # =====================================================================================
 # Basic colored output (works in modern Windows terminals with ANSI support)
@@ -42,6 +58,26 @@ def write_tell(msg: str):
 PROJECT_ROOT = r"K:\Freqtrade"
 CONFIG_FOLDER = "user_data"  # relative (as seen inside container)
 HYPEROPTS_FOLDER = os.path.join(PROJECT_ROOT, "user_data", "hyperopts")
+STRATEGIES_FOLDER = os.path.join(PROJECT_ROOT, "user_data", "strategies")
+HYPEROPT_RESULTS_FOLDER = os.path.join(PROJECT_ROOT, "user_data", "hyperopt_results")
+
+# Successive-halving defaults
+DEFAULT_HALVING_CANDIDATES = 200
+DEFAULT_HALVING_MIN_DAYS = 30
+DEFAULT_HALVING_KEEP_FRACTION = 0.5
+
+# Warm-start defaults
+# Kept outside user_data/strategies so the copy never shadows the original strategy
+WARMSTART_FOLDER = os.path.join(PROJECT_ROOT, "user_data", "warmstart")
+DEFAULT_WARMSTART_TOP = 10
+DEFAULT_WARMSTART_MARGIN = 0.1
+PARAMETER_TYPES = (
+    "IntParameter",
+    "DecimalParameter",
+    "RealParameter",
+    "CategoricalParameter",
+    "BooleanParameter",
+)
 
 
 def ensure_working_directory():
@@ -294,16 +330,46 @@ def run_docker_command(
     workers: int,
     hyperopt_loss: str,
     config_file: str,
+    strategy_path: str = None,
 ):
     ensure_working_directory()
 
     spaces_list = [s for s in spaces.split() if s]
+    strategy_path_option = ["--strategy-path", strategy_path] if strategy_path else []
+
+    # Unique name so several hyperopts can run side by side
+    container_name = f"Hyperopt_{os.getpid()}"
+    with planned_cpus(container_name, workers) as cpus:
+        # One joblib worker per assigned core, so the container is not oversubscribed
+        if cpus:
+            workers = min(workers, len(cpus))
+        run_hyperopt_container(
+            container_name,
+            timerange,
+            spaces_list,
+            epochs,
+            workers,
+            hyperopt_loss,
+            config_file,
+            strategy_path_option,
+        )
+
 
+def run_hyperopt_container(
+    container_name: str,
+    timerange: str,
+    spaces_list: list,
+    epochs: int,
+    workers: int,
+    hyperopt_loss: str,
+    config_file: str,
+    strategy_path_option: list,
+):
     cmd = [
         "docker-compose",
         "run",
         "--name",
-        "Hyperopt",
+        container_name,
         "--rm",
         "freqtrade",
         "hyperopt",
@@ -323,14 +389,835 @@ def run_docker_command(
         str(workers),
         "--hyperopt-loss",
         hyperopt_loss,
-    ]
+    ] + strategy_path_option
 
     write_action_line("Running command: " + " ".join(cmd))
 
+    run_recorded("hyperopt", cmd, container_name, config_file, timerange, workers)
+
+
+# =====================================================================================
+# Function to choose between a normal run and a successive-halving run
+# =====================================================================================
+def get_run_mode() -> str:
+    while True:
+        write_action_line("Choose the hyperopt mode:")
+        write_warning_line("1:   Standard                  - One hyperopt over the full timerange.")
+        write_warning_line("2:   Successive Halving        - Many candidates on a short timerange, best ones promoted to longer ranges.")
+        write_warning_line("3:   Warm Start (Narrowed)     - Narrow the parameter ranges around the best sets of previous runs for this strategy.")
+        choice = input("Enter your choice: ").strip()
+
+        if choice == "1":
+            return "standard"
+        elif choice == "2":
+            return "halving"
+        elif choice == "3":
+            return "warmstart"
+        else:
+            write_error_line("Invalid choice. Please enter a number between 1 and 3.")
+
+
+# =====================================================================================
+# Function to get the successive-halving settings from the user
+# =====================================================================================
+def get_halving_settings() -> dict:
+    while True:
+        write_action_line(
+            f"Enter the number of candidates for the first rung (default {DEFAULT_HALVING_CANDIDATES}):"
+        )
+        candidates = input().strip()
+        if not candidates:
+            candidates = DEFAULT_HALVING_CANDIDATES
+            break
+        if candidates.isdigit() and int(candidates) > 1:
+            candidates = int(candidates)
+            break
+        write_error_line("Invalid input. Please enter an integer greater than 1.")
+
+    while True:
+        write_action_line(
+            f"Enter the number of days for the first rung (default {DEFAULT_HALVING_MIN_DAYS}):"
+        )
+        min_days = input().strip()
+        if not min_days:
+            min_days = DEFAULT_HALVING_MIN_DAYS
+            break
+        if min_days.isdigit() and int(min_days) > 0:
+            min_days = int(min_days)
+            break
+        write_error_line("Invalid input. Please enter a positive integer for days.")
+
+    while True:
+        write_action_line(
+            f"Enter the fraction of candidates promoted to the next rung (default {DEFAULT_HALVING_KEEP_FRACTION}):"
+        )
+        keep_fraction = input().strip()
+        if not keep_fraction:
+            keep_fraction = DEFAULT_HALVING_KEEP_FRACTION
+            break
+        try:
+            keep_fraction = float(keep_fraction)
+        except ValueError:
+            keep_fraction = 0.0
+        if 0.0 < keep_fraction < 1.0:
+            break
+        write_error_line("Invalid input. Please enter a number between 0 and 1 (e.g. 0.5).")
+
+    return {
+        "candidates": candidates,
+        "min_days": min_days,
+        "keep_fraction": keep_fraction,
+    }
+
+
+# =====================================================================================
+# Successive-halving helpers
+# =====================================================================================
+def build_halving_rungs(timerange: str, min_days: int) -> list:
+    """
+    Splits the full timerange into growing rungs that all end on the same date:
+    min_days, 2 * min_days, 4 * min_days, ... and finally the full timerange.
+    """
+    start_str, end_str = timerange.split("-")
+    start = datetime.strptime(start_str, "%Y%m%d")
+    end = datetime.strptime(end_str, "%Y%m%d")
+    total_days = (end - start).days
+
+    rungs = []
+    days = min_days
+    while days < total_days:
+        rung_start = end - timedelta(days=days)
+        rungs.append(f"{rung_start:%Y%m%d}-{end_str}")
+        days *= 2
+    rungs.append(timerange)
+    return rungs
+
+
+def get_config_strategy(config_file: str):
+    config_path = os.path.join(PROJECT_ROOT, *config_file.split("/"))
     try:
-        subprocess.run(cmd, check=False)
+        config = load_json_config(config_path)
     except Exception as e:
-        write_error_line(f"Failed to run docker command: {e}")
+        write_error_line(f"Failed to read {config_path}: {e}")
+        return None
+
+    strategy = config.get("strategy")
+    if not strategy:
+        write_error_line(f"No 'strategy' set in {config_file}.")
+        return None
+    return strategy
+
+
+def get_latest_hyperopt_result():
+    last_result = os.path.join(HYPEROPT_RESULTS_FOLDER, ".last_result.json")
+    try:
+        with open(last_result, "r", encoding="utf-8") as f:
+            latest = json.load(f)["latest_hyperopt"]
+    except Exception:
+        return None
+    return os.path.join(HYPEROPT_RESULTS_FOLDER, latest)
+
+
+def score_backtest(strategy_result: dict, hyperopt_loss: str) -> float:
+    """
+    Turns a backtest result into a loss (lower is better), using the metric that
+    is closest to the chosen hyperopt loss. Custom losses fall back to profit.
+    """
+    if not strategy_result or not strategy_result.get("total_trades"):
+        return math.inf
+
+    if hyperopt_loss.startswith("Sharpe"):
+        return -float(strategy_result.get("sharpe") or 0.0)
+    if hyperopt_loss.startswith("Sortino"):
+        return -float(strategy_result.get("sortino") or 0.0)
+    if hyperopt_loss.startswith("Calmar"):
+        return -float(strategy_result.get("calmar") or 0.0)
+    if hyperopt_loss.startswith("MaxDrawDown"):
+        return float(strategy_result.get("max_drawdown_account") or 0.0)
+    return -float(strategy_result.get("profit_total") or 0.0)
+
+
+def clone_strategy_candidate(
+    strategy_file: str,
+    strategy_name: str,
+    clone_name: str,
+    params: dict,
+    target_dir: str,
+):
+    """
+    Copies the strategy under a new class name and writes the candidate's
+    parameters next to it, so freqtrade loads them like an exported parameter file.
+    """
+    with open(strategy_file, "r", encoding="utf-8") as f:
+        content = f.read()
+
+    content = re.sub(
+        rf"class\s+{re.escape(strategy_name)}\s*\(",
+        f"class {clone_name}(",
+        content,
+        count=1,
+    )
+
+    with open(os.path.join(target_dir, f"{clone_name}.py"), "w", encoding="utf-8") as f:
+        f.write(content)
+
+    with open(os.path.join(target_dir, f"{clone_name}.json"), "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "strategy_name": clone_name,
+                "params": params,
+                "ft_stratparam_v": 1,
+                "export_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            },
+            f,
+            indent=4,
+        )
+
+
+def write_rung_file(run_dir: str, rung: int, timerange: str, candidates: list) -> str:
+    rung_file = os.path.join(run_dir, f"rung_{rung}.json")
+    with open(rung_file, "w", encoding="utf-8") as f:
+        json.dump({"rung": rung, "timerange": timerange, "candidates": candidates}, f, indent=4)
+    return rung_file
+
+
+def read_rung_file(run_dir: str, rung: int) -> list:
+    with open(os.path.join(run_dir, f"rung_{rung}.json"), "r", encoding="utf-8") as f:
+        return json.load(f)["candidates"]
+
+
+def promote_candidates(candidates: list, keep_fraction: float) -> list:
+    ranked = sorted(
+        (c for c in candidates if math.isfinite(c["loss"])), key=lambda c: c["loss"]
+    )
+    keep = max(1, math.ceil(len(ranked) * keep_fraction))
+    return ranked[:keep]
+
+
+# =====================================================================================
+# Function to evaluate promoted candidates on a longer timerange
+# =====================================================================================
+def run_halving_rung(
+    run_dir: str,
+    run_name: str,
+    rung: int,
+    timerange: str,
+    candidates: list,
+    strategy_file: str,
+    strategy_name: str,
+    workers: int,
+    hyperopt_loss: str,
+    config_file: str,
+    timeframe: str,
+) -> list:
+    """
+    Backtests every candidate on the rung's timerange. Candidates are spread over
+    up to `workers` containers, each one loading the data once for its whole
+    --strategy-list.
+    """
+    ensure_working_directory()
+
+    rung_dir = os.path.join(run_dir, f"rung_{rung}")
+    os.makedirs(rung_dir, exist_ok=True)
+    rung_dir_rel = f"{CONFIG_FOLDER}/hyperopt_results/{run_name}/rung_{rung}"
+
+    clone_names = {}
+    for candidate in candidates:
+        clone_name = f"{strategy_name}_R{rung}C{candidate['id']}"
+        clone_strategy_candidate(
+            strategy_file, strategy_name, clone_name, candidate["params"], rung_dir
+        )
+        clone_names[clone_name] = candidate
+
+    names = list(clone_names)
+    group_count = max(1, min(workers, len(names)))
+    groups = [names[g::group_count] for g in range(group_count)]
+
+    launches = []
+    for g, group in enumerate(groups):
+        export_dir = os.path.join(rung_dir, f"group_{g}")
+        os.makedirs(export_dir, exist_ok=True)
+        # Unique per launcher, like the hyperopt container, so parallel halving runs do not clash
+        container_name = f"Halving_{os.getpid()}_R{rung}_G{g}"
+
+        cmd = [
+            "docker-compose",
+            "run",
+            "--name",
+            container_name,
+            "--rm",
+            "freqtrade",
+            "backtesting",
+            "--config",
+            config_file,
+            "--data-format-ohlcv",
+            "feather",
+            "--cache",
+            "none",
+            "--timerange",
+            timerange,
+            # --strategy-list loads each clone on a copy of the config, which may not set one
+            "--timeframe",
+            timeframe,
+            "--strategy-path",
+            rung_dir_rel,
+            "--export",
+            "trades",
+            "--export-filename",
+            f"{rung_dir_rel}/group_{g}",
+            "--strategy-list",
+        ] + group
+
+        write_action_line("Running command: " + " ".join(cmd))
+        launches.append((export_dir, container_name, cmd))
+
+    def run_group(container_name: str, cmd: list):
+        with planned_cpus(container_name, 1):
+            run_recorded("backtest", cmd, container_name, config_file, timerange)
+
+    with ThreadPoolExecutor(max_workers=len(launches)) as pool:
+        futures = [
+            pool.submit(run_group, container_name, cmd) for _, container_name, cmd in launches
+        ]
+        for (_, container_name, _), future in zip(launches, futures):
+            try:
+                future.result()
+            except Exception as e:
+                write_error_line(f"{container_name} failed: {e}")
+
+    scored = []
+    for export_dir, _, _ in launches:
+        _, result = load_backtest_result(export_dir)
+        strategies = (result or {}).get("strategy", {})
+        for clone_name in names:
+            if clone_name in strategies:
+                candidate = dict(clone_names[clone_name])
+                candidate["loss"] = score_backtest(strategies[clone_name], hyperopt_loss)
+                scored.append(candidate)
+
+    missing = len(names) - len(scored)
+    if missing:
+        write_warning_line(f"{missing} candidate(s) produced no backtest result in rung {rung}.")
+    return scored
+
+
+# =====================================================================================
+# Function to run a successive-halving hyperopt
+# =====================================================================================
+def run_successive_halving(
+    timerange: str,
+    spaces: str,
+    workers: int,
+    hyperopt_loss: str,
+    config_file: str,
+    halving: dict,
+):
+    ensure_working_directory()
+
+    strategy_name = get_config_strategy(config_file)
+    if not strategy_name:
+        return
+    strategy_file = find_strategy_file(strategy_name)
+    if not strategy_file:
+        write_error_line(f"Could not find strategy {strategy_name} in {STRATEGIES_FOLDER}.")
+        return
+    config = load_json_config(os.path.join(PROJECT_ROOT, *config_file.split("/")))
+    timeframe = config.get("timeframe") or get_strategy_timeframe(strategy_name)
+    if not timeframe:
+        write_error_line(f"No timeframe set in {config_file} or {strategy_name}.")
+        return
+
+    rungs = build_halving_rungs(timerange, halving["min_days"])
+    run_name = f"halving_{strategy_name}_{datetime.now():%Y%m%d_%H%M%S}"
+    run_dir = os.path.join(HYPEROPT_RESULTS_FOLDER, run_name)
+    os.makedirs(run_dir, exist_ok=True)
+
+    write_tell(f"Successive halving over {len(rungs)} rung(s): " + ", ".join(rungs))
+
+    # Rung 0: a regular hyperopt with all candidates on the shortest timerange
+    previous_result = get_latest_hyperopt_result()
+    run_docker_command(
+        rungs[0], spaces, halving["candidates"], workers, hyperopt_loss, config_file
+    )
+    result_file = get_latest_hyperopt_result()
+    if not result_file or result_file == previous_result:
+        write_error_line("Hyperopt did not produce a new result file. Stopping.")
+        return
+
+    candidates = []
+    for epoch in load_hyperopt_epochs(result_file):
+        metrics = epoch.get("results_metrics", {})
+        loss = epoch.get("loss")
+        if not metrics.get("total_trades") or loss is None:
+            loss = math.inf
+        candidates.append(
+            {
+                "id": epoch.get("current_epoch", len(candidates) + 1),
+                "loss": loss,
+                # Clones do not read the strategy's own .json, so the spaces that were
+                # not optimized have to come with the candidate
+                "params": get_epoch_parameters(epoch),
+            }
+        )
+    write_rung_file(run_dir, 0, rungs[0], candidates)
+
+    for rung in range(1, len(rungs)):
+        promoted = promote_candidates(read_rung_file(run_dir, rung - 1), halving["keep_fraction"])
+        if not promoted:
+            write_error_line(f"No candidate with trades left after rung {rung - 1}. Stopping.")
+            return
+
+        write_tell(
+            f"Rung {rung}: {len(promoted)} candidate(s) promoted to timerange {rungs[rung]}"
+        )
+        scored = run_halving_rung(
+            run_dir,
+            run_name,
+            rung,
+            rungs[rung],
+            promoted,
+            strategy_file,
+            strategy_name,
+            workers,
+            hyperopt_loss,
+            config_file,
+            timeframe,
+        )
+        write_rung_file(run_dir, rung, rungs[rung], scored)
+
+    final = promote_candidates(read_rung_file(run_dir, len(rungs) - 1), 0.0)
+    if not final:
+        write_error_line("No candidate survived the last rung.")
+        return
+
+    best = final[0]
+    best_file = os.path.join(run_dir, f"{strategy_name}.json")
+    with open(best_file, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "strategy_name": strategy_name,
+                "params": best["params"],
+                "ft_stratparam_v": 1,
+                "export_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            },
+            f,
+            indent=4,
+        )
+
+    write_tell(f"Best candidate: epoch {best['id']} with loss {best['loss']:.5f}")
+    write_info_line(json.dumps(best["params"], indent=4))
+    write_action_line(f"Parameters written to {best_file}")
+    write_warning_line(
+        f"Copy it next to {os.path.basename(strategy_file)} in {STRATEGIES_FOLDER} to use it."
+    )
+
+
+# =====================================================================================
+# Function to get the warm-start settings from the user
+# =====================================================================================
+def get_warmstart_settings() -> dict:
+    while True:
+        write_action_line(
+            f"Enter how many of the best previous parameter sets to use (default {DEFAULT_WARMSTART_TOP}):"
+        )
+        top = input().strip()
+        if not top:
+            top = DEFAULT_WARMSTART_TOP
+            break
+        if top.isdigit() and int(top) > 0:
+            top = int(top)
+            break
+        write_error_line("Invalid input. Please enter a positive integer.")
+
+    margin = DEFAULT_WARMSTART_MARGIN
+    while True:
+        write_action_line(
+            f"Enter the margin kept around the best values, as a fraction of the original range (default {DEFAULT_WARMSTART_MARGIN}):"
+        )
+        value = input().strip()
+        if not value:
+            break
+        try:
+            margin = float(value)
+        except ValueError:
+            margin = -1.0
+        if 0.0 <= margin <= 1.0:
+            break
+        write_error_line("Invalid input. Please enter a number between 0 and 1 (e.g. 0.1).")
+
+    return {"top": top, "margin": margin}
+
+
+# =====================================================================================
+# Warm-start helpers
+# =====================================================================================
+def get_parameter_spaces(spaces: str) -> set:
+    """
+    Maps the chosen --spaces to the strategy parameter spaces they optimize.
+    roi/stoploss/trailing/trades are generated by freqtrade and have no class parameters.
+    """
+    chosen = set(spaces.split())
+    if "all" in chosen:
+        return {"buy", "sell", "protection"}
+    parameter_spaces = chosen & {"buy", "sell", "protection"}
+    if "default" in chosen:
+        parameter_spaces |= {"buy", "sell"}
+    return parameter_spaces
+
+
+def parse_strategy_parameters(source: str, strategy_name: str) -> dict:
+    """
+    Finds the hyperoptable parameters declared on the strategy class, with their
+    space, bounds (or categories) and the call node so they can be rewritten.
+    """
+    tree = ast.parse(source)
+    strategy_class = next(
+        (
+            node
+            for node in ast.walk(tree)
+            if isinstance(node, ast.ClassDef) and node.name == strategy_name
+        ),
+        None,
+    )
+    if strategy_class is None:
+        return {}
+
+    parameters = {}
+    for stmt in strategy_class.body:
+        if not (
+            isinstance(stmt, ast.Assign)
+            and len(stmt.targets) == 1
+            and isinstance(stmt.targets[0], ast.Name)
+            and isinstance(stmt.value, ast.Call)
+        ):
+            continue
+
+        call = stmt.value
+        func = call.func
+        param_type = func.attr if isinstance(func, ast.Attribute) else getattr(func, "id", None)
+        if param_type not in PARAMETER_TYPES:
+            continue
+
+        name = stmt.targets[0].id
+        keywords = {kw.arg: kw.value for kw in call.keywords if kw.arg}
+
+        try:
+            if keywords.get("optimize") is not None and not ast.literal_eval(keywords["optimize"]):
+                continue
+
+            if "space" in keywords:
+                space = ast.literal_eval(keywords["space"])
+            else:
+                space = name.split("_")[0]
+            if space not in ("buy", "sell", "protection"):
+                continue
+
+            parameter = {"type": param_type, "space": space, "call": call}
+            if param_type == "BooleanParameter":
+                parameter["categories"] = [True, False]
+            elif param_type == "CategoricalParameter":
+                categories = call.args[0] if call.args else keywords["categories"]
+                parameter["categories"] = list(ast.literal_eval(categories))
+            else:
+                low = call.args[0] if call.args else keywords["low"]
+                low = ast.literal_eval(low)
+                if isinstance(low, (list, tuple)):
+                    low, high = low
+                else:
+                    high = call.args[1] if len(call.args) > 1 else keywords["high"]
+                    high = ast.literal_eval(high)
+                parameter["low"] = low
+                parameter["high"] = high
+                if "decimals" in keywords:
+                    parameter["decimals"] = ast.literal_eval(keywords["decimals"])
+        except (ValueError, KeyError, IndexError, TypeError, SyntaxError):
+            write_warning_line(f"Skipping parameter {name}: could not read its definition.")
+            continue
+
+        parameters[name] = parameter
+    return parameters
+
+
+def is_valid_parameter_value(parameter: dict, value) -> bool:
+    if "categories" in parameter:
+        return value in parameter["categories"]
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return False
+    if parameter["type"] == "IntParameter" and int(value) != value:
+        return False
+    return parameter["low"] <= value <= parameter["high"]
+
+
+def score_warmstart_epoch(metrics: dict, hyperopt_loss: str) -> float:
+    """
+    Puts epochs of different runs on one scale (lower is better). Their stored loss
+    depends on the loss function and timerange of that run, so the metric closest
+    to the current loss is used instead, with profit taken per backtest day.
+    """
+    score = score_backtest(metrics, hyperopt_loss)
+    days = metrics.get("backtest_days")
+    if math.isfinite(score) and days and not hyperopt_loss.startswith(
+        ("Sharpe", "Sortino", "Calmar", "MaxDrawDown")
+    ):
+        score /= days
+    return score
+
+
+def collect_warmstart_sets(
+    strategy_name: str, parameters: dict, top: int, hyperopt_loss: str
+) -> list:
+    """
+    Reads every previous result file of the strategy and returns the `top` best
+    epochs whose parameters all fit the current search space, ranked with
+    score_warmstart_epoch.
+    """
+    pattern = os.path.join(HYPEROPT_RESULTS_FOLDER, f"strategy_{strategy_name}_*.fthypt")
+    runs = []
+    for result_file in sorted(glob.glob(pattern)):
+        try:
+            runs.append((os.path.basename(result_file), load_hyperopt_epochs(result_file)))
+        except Exception as e:
+            write_warning_line(f"Skipping {os.path.basename(result_file)}: {e}")
+    # Runs moved into the result store are still usable
+    runs.extend(load_archived_hyperopt_epochs(strategy_name))
+
+    valid_sets = []
+    rejected = 0
+    for result_name, epochs in runs:
+        for epoch in epochs:
+            metrics = epoch.get("results_metrics", {})
+            if not metrics.get("total_trades"):
+                continue
+            params = epoch.get("params_dict", {})
+            if not all(
+                name in params and is_valid_parameter_value(parameter, params[name])
+                for name, parameter in parameters.items()
+            ):
+                rejected += 1
+                continue
+            valid_sets.append(
+                {
+                    "score": score_warmstart_epoch(metrics, hyperopt_loss),
+                    "file": result_name,
+                    "epoch": epoch.get("current_epoch"),
+                    "params": {name: params[name] for name in parameters},
+                }
+            )
+
+    write_info_line(
+        f"Found {len(valid_sets)} usable epoch(s) in {len(runs)} result file(s), "
+        f"{rejected} rejected because they do not fit the current search space."
+    )
+    valid_sets = [s for s in valid_sets if math.isfinite(s["score"])]
+    valid_sets.sort(key=lambda s: s["score"])
+    return valid_sets[:top]
+
+
+def narrow_parameter(parameter: dict, values: list, margin: float):
+    """
+    Returns new (low, high) bounds that cover all given values plus a margin,
+    clipped to the original bounds.
+    """
+    span = parameter["high"] - parameter["low"]
+    low = max(parameter["low"], min(values) - span * margin)
+    high = min(parameter["high"], max(values) + span * margin)
+
+    if parameter["type"] == "IntParameter":
+        low, high = int(math.floor(low)), int(math.ceil(high))
+    elif parameter["type"] == "DecimalParameter":
+        decimals = parameter.get("decimals", 3)
+        step = 10 ** -decimals
+        low = max(parameter["low"], round(math.floor(low / step) * step, decimals))
+        high = min(parameter["high"], round(math.ceil(high / step) * step, decimals))
+
+    if low == high:
+        # Optimizers need a non-empty range, so widen by one step where possible
+        step = 1 if parameter["type"] == "IntParameter" else 10 ** -parameter.get("decimals", 3)
+        low = max(parameter["low"], low - step)
+        high = min(parameter["high"], high + step)
+    return low, high
+
+
+def build_parameter_call(source: str, parameter: dict, default, bounds=None) -> str:
+    call = parameter["call"]
+    func = ast.get_source_segment(source, call.func)
+    skipped = {"low", "high", "categories", "default"}
+    keywords = [
+        f"{kw.arg}={ast.get_source_segment(source, kw.value)}"
+        for kw in call.keywords
+        if kw.arg and kw.arg not in skipped
+    ]
+
+    if "categories" in parameter:
+        if parameter["type"] == "BooleanParameter":
+            args = [f"default={default!r}"]
+        else:
+            args = [repr(parameter["categories"]), f"default={default!r}"]
+    else:
+        low, high = bounds if bounds else (parameter["low"], parameter["high"])
+        args = [repr(low), repr(high), f"default={default!r}"]
+
+    return f"{func}({', '.join(args + keywords)})"
+
+
+def write_warmstart_strategy(
+    strategy_file: str,
+    parameters: dict,
+    warm_sets: list,
+    margin: float,
+) -> str:
+    """
+    Writes a copy of the strategy into WARMSTART_FOLDER with the numeric ranges
+    narrowed around the best previous sets. Freqtrade's optimizer starts from
+    random points and never evaluates the defaults, so the narrowed ranges are
+    what steers the search; the best set only becomes the default.
+    The strategy's exported .json is copied along, so the spaces that are not
+    optimized keep their tuned values, like in a normal run of the strategy.
+    """
+    with open(strategy_file, "r", encoding="utf-8") as f:
+        source = f.read()
+
+    best = warm_sets[0]["params"]
+    replacements = []
+    for name, parameter in parameters.items():
+        bounds = None
+        if "categories" not in parameter:
+            bounds = narrow_parameter(
+                parameter, [s["params"][name] for s in warm_sets], margin
+            )
+            write_info_line(
+                f"{name}: {parameter['low']}..{parameter['high']} -> {bounds[0]}..{bounds[1]}"
+                f" (best {best[name]})"
+            )
+        else:
+            write_info_line(f"{name}: default -> {best[name]!r}")
+        replacements.append(
+            (parameter["call"], build_parameter_call(source, parameter, best[name], bounds))
+        )
+
+    # Replace from the end of the file so earlier offsets stay valid
+    lines = source.splitlines(keepends=True)
+    offsets = [0]
+    for line in lines:
+        offsets.append(offsets[-1] + len(line.encode("utf-8")))
+    encoded = source.encode("utf-8")
+    for call, text in sorted(replacements, key=lambda r: (r[0].lineno, r[0].col_offset), reverse=True):
+        start = offsets[call.lineno - 1] + call.col_offset
+        end = offsets[call.end_lineno - 1] + call.end_col_offset
+        encoded = encoded[:start] + text.encode("utf-8") + encoded[end:]
+
+    os.makedirs(WARMSTART_FOLDER, exist_ok=True)
+    target = os.path.join(WARMSTART_FOLDER, os.path.basename(strategy_file))
+    with open(target, "w", encoding="utf-8") as f:
+        f.write(encoded.decode("utf-8"))
+
+    # Freqtrade reads the .json next to the strategy file it loads
+    params_file = os.path.splitext(strategy_file)[0] + ".json"
+    target_params_file = os.path.splitext(target)[0] + ".json"
+    if os.path.exists(params_file):
+        with open(params_file, "r", encoding="utf-8") as f:
+            exported = json.load(f)
+        # Exported values would override the narrowed defaults of the optimized spaces
+        for name, parameter in parameters.items():
+            space_params = exported.get("params", {}).get(parameter["space"])
+            if isinstance(space_params, dict) and name in space_params:
+                space_params[name] = best[name]
+        with open(target_params_file, "w", encoding="utf-8") as f:
+            json.dump(exported, f, indent=4)
+    elif os.path.exists(target_params_file):
+        os.remove(target_params_file)
+    return target
+
+
+# =====================================================================================
+# Function to run a hyperopt warm-started from previous results
+# =====================================================================================
+def run_warmstart_hyperopt(
+    timerange: str,
+    spaces: str,
+    epochs: int,
+    workers: int,
+    hyperopt_loss: str,
+    config_file: str,
+    warmstart: dict,
+):
+    ensure_working_directory()
+
+    strategy_name = get_config_strategy(config_file)
+    if not strategy_name:
+        return
+    strategy_file = find_strategy_file(strategy_name)
+    if not strategy_file:
+        write_error_line(f"Could not find strategy {strategy_name} in {STRATEGIES_FOLDER}.")
+        return
+
+    with open(strategy_file, "r", encoding="utf-8") as f:
+        source = f.read()
+    parameter_spaces = get_parameter_spaces(spaces)
+    parameters = {
+        name: parameter
+        for name, parameter in parse_strategy_parameters(source, strategy_name).items()
+        if parameter["space"] in parameter_spaces
+    }
+
+    if not parameters:
+        write_warning_line(
+            "No strategy parameters in the chosen spaces. Running a normal hyperopt instead."
+        )
+        run_docker_command(timerange, spaces, epochs, workers, hyperopt_loss, config_file)
+        return
+
+    warm_sets = collect_warmstart_sets(strategy_name, parameters, warmstart["top"], hyperopt_loss)
+    if not warm_sets:
+        write_warning_line(
+            "No previous parameter sets fit the current search space. Running a normal hyperopt instead."
+        )
+        run_docker_command(timerange, spaces, epochs, workers, hyperopt_loss, config_file)
+        return
+
+    for s in warm_sets:
+        write_info_line(f"Score {s['score']:.5f} - epoch {s['epoch']} of {s['file']}")
+
+    target = write_warmstart_strategy(strategy_file, parameters, warm_sets, warmstart["margin"])
+    write_action_line(f"Warm-start strategy written to {target}")
+
+    run_docker_command(
+        timerange,
+        spaces,
+        epochs,
+        workers,
+        hyperopt_loss,
+        config_file,
+        strategy_path=f"{CONFIG_FOLDER}/warmstart",
+    )
+
+
+# =====================================================================================
+# Function to run the chosen mode with the collected parameters
+# =====================================================================================
+def run_selected_mode(
+    mode: str,
+    timerange: str,
+    spaces: str,
+    epochs: int,
+    workers: int,
+    hyperopt_loss: str,
+    config_file: str,
+    halving: dict,
+    warmstart: dict,
+):
+    if mode == "halving":
+        run_successive_halving(
+            timerange, spaces, workers, hyperopt_loss, config_file, halving
+        )
+    elif mode == "warmstart":
+        run_warmstart_hyperopt(
+            timerange, spaces, epochs, workers, hyperopt_loss, config_file, warmstart
+        )
+    else:
+        run_docker_command(
+            timerange, spaces, epochs, workers, hyperopt_loss, config_file
+        )
 
 
 # =====================================================================================
@@ -339,10 +1226,13 @@ def run_docker_command(
 def main():
     ensure_working_directory()
 
+    mode = get_run_mode()
     timerange = get_timerange()
     config_file = get_config_file()
     spaces = get_spaces()
-    epochs = get_epochs()
+    epochs = get_epochs() if mode != "halving" else 0
+    halving = get_halving_settings() if mode == "halving" else {}
+    warmstart = get_warmstart_settings() if mode == "warmstart" else {}
     workers = get_workers()
     hyperopt_loss = get_hyperopt_loss()
 
@@ -356,7 +1246,9 @@ def main():
             )
             sys.exit(1)
 
-    run_docker_command(timerange, spaces, epochs, workers, hyperopt_loss, config_file)
+    run_selected_mode(
+        mode, timerange, spaces, epochs, workers, hyperopt_loss, config_file, halving, warmstart
+    )
 
     while True:
         write_action_line(
@@ -375,15 +1267,18 @@ def main():
 
         if user_input == "r":
             write_tell("Retrying with the same parameters...")
-            run_docker_command(
-                timerange, spaces, epochs, workers, hyperopt_loss, config_file
+            run_selected_mode(
+                mode, timerange, spaces, epochs, workers, hyperopt_loss, config_file, halving, warmstart
             )
 
         elif user_input == "n":
+            mode = get_run_mode()
             timerange = get_timerange()
             config_file = get_config_file()
             spaces = get_spaces()
-            epochs = get_epochs()
+            epochs = get_epochs() if mode != "halving" else 0
+            halving = get_halving_settings() if mode == "halving" else {}
+            warmstart = get_warmstart_settings() if mode == "warmstart" else {}
             workers = get_workers()
             hyperopt_loss = get_hyperopt_loss()
 
@@ -398,8 +1293,8 @@ def main():
                     sys.exit(1)
 
             write_warning_line("Running command with new parameters...")
-            run_docker_command(
-                timerange, spaces, epochs, workers, hyperopt_loss, config_file
+            run_selected_mode(
+                mode, timerange, spaces, epochs, workers, hyperopt_loss, config_file, halving, warmstart
             )
 
         elif user_input == "e":
@@ -0,0 +1,467 @@
+#!/usr/bin/env python
+import os
+import re
+import glob
+import json
+import shutil
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+from Freqtrade_Cpu_Planner import planned_cpus
+from Freqtrade_Result_Store import load_archived_hyperopt_epochs
+from Freqtrade_Run_History import (
+    find_strategy_file,
+    get_epoch_parameters,
+    load_backtest_result,
+    load_hyperopt_epochs,
+    load_json_config,
+    run_recorded,
+)
+
+# =====================================================================================
+# Basic colored output (works in modern Windows terminals with ANSI support)
+# =====================================================================================
+RESET = "\033[0m"
+RED = "\033[31m"
+WHITE = "\033[37m"
+YELLOW = "\033[33m"
+GREEN = "\033[32m"
+BLUE = "\033[34m"
+
+
+def write_error_line(msg: str):
+    print(f"{RED}{msg}{RESET}")
+
+
+def write_info_line(msg: str):
+    print(f"{WHITE}{msg}{RESET}")
+
+
+def write_warning_line(msg: str):
+    print(f"{YELLOW}{msg}{RESET}")
+
+
+def write_action_line(msg: str):
+    print(f"{GREEN}{msg}{RESET}")
+
+
+def write_tell(msg: str):
+    print(f"{BLUE}{msg}{RESET}")
+
+
+# =====================================================================================
+# Config / path constants
+# =====================================================================================
+PROJECT_ROOT = r"K:\Freqtrade"
+CONFIG_FOLDER = "user_data"  # relative (as seen inside container)
+STRATEGIES_FOLDER = os.path.join(PROJECT_ROOT, "user_data", "strategies")
+HYPEROPT_RESULTS_FOLDER = os.path.join(PROJECT_ROOT, "user_data", "hyperopt_results")
+BACKTEST_RESULTS_FOLDER = os.path.join(PROJECT_ROOT, "user_data", "backtest_results")
+PROMOTION_LOG = os.path.join(PROJECT_ROOT, "user_data", "logs", "promotion.log")
+
+SEND_STRATEGIES_FOLDER = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "Send Strategies"
+)
+DISTRIBUTOR_SCRIPT = os.path.join(SEND_STRATEGIES_FOLDER, "File_distributer using SSH.ps1")
+# The distributor is given this file too (-DistributionFile), so the bots checked
+# here are the bots it deploys to
+STRATEGY_DISTRIBUTION_FILE = os.path.join(PROJECT_ROOT, "user_data", "strategy_distribution.json")
+
+# Acceptance thresholds for the validation backtest
+DEFAULT_MIN_TRADES = 20
+DEFAULT_MIN_PROFIT = 0.0  # profit_total, 0.05 = +5%
+DEFAULT_MAX_DRAWDOWN = 0.25  # max_drawdown_account, 0.25 = 25%
+
+
+def ensure_working_directory():
+    if os.getcwd().lower() != PROJECT_ROOT.lower():
+        write_warning_line(f"Switching to expected working directory: {PROJECT_ROOT}")
+        try:
+            os.chdir(PROJECT_ROOT)
+        except Exception as e:
+            write_error_line(f"Failed to change directory to {PROJECT_ROOT}. {e}")
+            sys.exit(1)
+
+
+# =====================================================================================
+# Stage timing / logging
+# =====================================================================================
+def log_line(msg: str):
+    os.makedirs(os.path.dirname(PROMOTION_LOG), exist_ok=True)
+    with open(PROMOTION_LOG, "a", encoding="utf-8") as f:
+        f.write(f"{datetime.now():%Y-%m-%d %H:%M:%S} {msg}\n")
+
+
+@contextmanager
+def stage(name: str):
+    write_action_line(f"=== {name} ===")
+    log_line(f"START {name}")
+    started = time.time()
+    status = "FAILED"
+    try:
+        yield
+        status = "DONE"
+    finally:
+        elapsed = time.time() - started
+        log_line(f"{status} {name} ({elapsed:.1f}s)")
+        write_tell(f"{name}: {status.lower()} in {elapsed:.1f}s")
+
+
+# =====================================================================================
+# Function to choose a config
+# =====================================================================================
+def get_config_file() -> str:
+    """
+    Returns a RELATIVE path like 'user_data/config-1.json'
+    so it works inside the Docker container.
+    """
+    config_folder_path = os.path.join(PROJECT_ROOT, CONFIG_FOLDER)
+    configs = sorted(glob.glob(os.path.join(config_folder_path, "config-*.json")))
+    if not configs:
+        write_error_line(f"No config-*.json files found in '{config_folder_path}'.")
+        sys.exit(1)
+
+    while True:
+        write_action_line("Available Configs:")
+        for idx, cfg in enumerate(configs, start=1):
+            write_info_line(f"{idx}. {os.path.basename(cfg)}")
+
+        choice = input(f"Enter your choice (1-{len(configs)}): ").strip()
+        if choice.isdigit() and 1 <= int(choice) <= len(configs):
+            return f"{CONFIG_FOLDER}/{os.path.basename(configs[int(choice) - 1])}"
+
+        write_error_line(
+            f"Invalid input. Please enter a number between 1 and {len(configs)}."
+        )
+
+
+# =====================================================================================
+# Function to choose the hyperopt result and epoch
+# =====================================================================================
+def select_hyperopt_epoch(strategy_name: str):
+    pattern = os.path.join(HYPEROPT_RESULTS_FOLDER, f"strategy_{strategy_name}_*.fthypt")
+    result_files = sorted(glob.glob(pattern), key=os.path.getmtime, reverse=True)
+    results = [(os.path.basename(path), path) for path in result_files]
+    # Runs moved into the result store (Freqtrade_Result_Store.py) can be promoted too
+    archived = sorted(load_archived_hyperopt_epochs(strategy_name), key=lambda run: run[0], reverse=True)
+    results += [(f"{name} (archived)", epochs) for name, epochs in archived]
+    if not results:
+        write_error_line(f"No hyperopt results found for {strategy_name}.")
+        return None
+
+    while True:
+        write_action_line("Available hyperopt results (newest first):")
+        for idx, (name, _) in enumerate(results, start=1):
+            write_info_line(f"{idx}. {name}")
+        choice = input(f"Enter your choice (1-{len(results)}, Enter = newest): ").strip()
+        if not choice:
+            result_name, source = results[0]
+            break
+        if choice.isdigit() and 1 <= int(choice) <= len(results):
+            result_name, source = results[int(choice) - 1]
+            break
+        write_error_line(
+            f"Invalid input. Please enter a number between 1 and {len(results)}."
+        )
+
+    epochs = source if isinstance(source, list) else load_hyperopt_epochs(source)
+    if not epochs:
+        write_error_line(f"{result_name} contains no epochs.")
+        return None
+    best = min(epochs, key=lambda e: e["loss"])
+
+    while True:
+        write_action_line(
+            f"Enter the epoch to promote (Enter = best epoch {best.get('current_epoch')}):"
+        )
+        choice = input().strip()
+        if not choice:
+            return best
+        if choice.isdigit():
+            for epoch in epochs:
+                if epoch.get("current_epoch") == int(choice):
+                    return epoch
+        write_error_line(f"Epoch {choice} not found in {result_name}.")
+
+
+# =====================================================================================
+# Function to get the validation timerange and thresholds
+# =====================================================================================
+def get_validation_timerange(epoch: dict) -> str:
+    """
+    Defaults to the held-out period right after the hyperopt timerange, up to today.
+    """
+    end = str(epoch.get("results_metrics", {}).get("backtest_end", ""))[:10]
+    default = None
+    if re.match(r"^\d{4}-\d{2}-\d{2}$", end):
+        default = f"{end.replace('-', '')}-{datetime.now():%Y%m%d}"
+
+    pattern = re.compile(r"^\d{8}-\d{8}$")
+    while True:
+        if default:
+            write_action_line(
+                f"Enter the held-out timerange (format: YYYYMMDD-YYYYMMDD, Enter = {default}):"
+            )
+        else:
+            write_action_line("Enter the held-out timerange (format: YYYYMMDD-YYYYMMDD):")
+        timerange = input().strip()
+        if not timerange and default:
+            return default
+        if pattern.match(timerange):
+            return timerange
+        write_error_line(
+            "Invalid input. Please enter the timerange in the format YYYYMMDD-YYYYMMDD."
+        )
+
+
+def get_threshold(prompt: str, default: float) -> float:
+    while True:
+        write_action_line(f"{prompt} (default {default}):")
+        value = input().strip()
+        if not value:
+            return default
+        try:
+            return float(value)
+        except ValueError:
+            write_error_line("Invalid input. Please enter a number.")
+
+
+def get_thresholds() -> dict:
+    return {
+        "min_trades": int(get_threshold("Minimum number of trades", DEFAULT_MIN_TRADES)),
+        "min_profit": get_threshold("Minimum total profit (0.05 = 5%)", DEFAULT_MIN_PROFIT),
+        "max_drawdown": get_threshold("Maximum drawdown (0.25 = 25%)", DEFAULT_MAX_DRAWDOWN),
+    }
+
+
+# =====================================================================================
+# Pipeline stages
+# =====================================================================================
+def export_parameters(strategy_name: str, strategy_file: str, epoch: dict):
+    """
+    Writes the epoch's parameters next to the strategy, like
+    `freqtrade hyperopt-show --print-json` would: the optimized values merged over
+    the ones that were not optimized. Returns (params_file, backup_file).
+    """
+    params_file = os.path.splitext(strategy_file)[0] + ".json"
+    backup_file = None
+    if os.path.exists(params_file):
+        backup_file = params_file + ".bak"
+        shutil.copy2(params_file, backup_file)
+
+    with open(params_file, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "strategy_name": strategy_name,
+                "params": get_epoch_parameters(epoch),
+                "ft_stratparam_v": 1,
+                "export_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            },
+            f,
+            indent=4,
+        )
+    return params_file, backup_file
+
+
+def restore_parameters(params_file: str, backup_file):
+    if backup_file:
+        shutil.move(backup_file, params_file)
+        write_warning_line(f"Previous parameters restored to {params_file}")
+    else:
+        os.remove(params_file)
+        write_warning_line(f"Removed {params_file}")
+
+
+def run_validation_backtest(config_file: str, strategy_name: str, timerange: str):
+    export_name = f"promote_{strategy_name}_{datetime.now():%Y%m%d_%H%M%S}"
+    export_dir = os.path.join(BACKTEST_RESULTS_FOLDER, export_name)
+    os.makedirs(export_dir, exist_ok=True)
+
+    container_name = f"Promote_{strategy_name}"
+    cmd = [
+        "docker-compose",
+        "run",
+        "--name",
+        container_name,
+        "--rm",
+        "freqtrade",
+        "backtesting",
+        "--config",
+        config_file,
+        "--strategy",
+        strategy_name,
+        "--data-format-ohlcv",
+        "feather",
+        "--cache",
+        "none",
+        "--timerange",
+        timerange,
+        "--export",
+        "trades",
+        "--export-filename",
+        f"{CONFIG_FOLDER}/backtest_results/{export_name}",
+    ]
+
+    write_action_line("Running command: " + " ".join(cmd))
+    with planned_cpus(container_name, 1):
+        run_recorded("backtest", cmd, container_name, config_file, timerange)
+
+    _, result = load_backtest_result(export_dir)
+    return (result or {}).get("strategy", {}).get(strategy_name)
+
+
+def check_thresholds(result: dict, thresholds: dict) -> bool:
+    checks = [
+        (
+            "trades",
+            result.get("total_trades", 0),
+            result.get("total_trades", 0) >= thresholds["min_trades"],
+            f">= {thresholds['min_trades']}",
+        ),
+        (
+            "profit",
+            result.get("profit_total", 0.0),
+            result.get("profit_total", 0.0) >= thresholds["min_profit"],
+            f">= {thresholds['min_profit']}",
+        ),
+        (
+            "drawdown",
+            result.get("max_drawdown_account", 0.0),
+            result.get("max_drawdown_account", 0.0) <= thresholds["max_drawdown"],
+            f"<= {thresholds['max_drawdown']}",
+        ),
+    ]
+
+    passed = True
+    for name, value, ok, rule in checks:
+        line = f"{name:<9} {value:<12} (required {rule})"
+        log_line(("PASS " if ok else "FAIL ") + line)
+        if ok:
+            write_info_line(f"PASS  {line}")
+        else:
+            write_error_line(f"FAIL  {line}")
+            passed = False
+    return passed
+
+
+def get_mapped_bots(strategy_file_name: str) -> list:
+    with open(STRATEGY_DISTRIBUTION_FILE, "r", encoding="utf-8") as f:
+        distribution = json.load(f)
+    return [bot for bot, files in distribution.items() if strategy_file_name in files]
+
+
+def deploy_to_bots(bots: list, files: list) -> bool:
+    cmd = [
+        "powershell",
+        "-NoProfile",
+        "-ExecutionPolicy",
+        "Bypass",
+        "-File",
+        DISTRIBUTOR_SCRIPT,
+        "-BotNames",
+        ",".join(bots),
+        "-Strategies",
+        ",".join(files),
+        "-DistributionFile",
+        STRATEGY_DISTRIBUTION_FILE,
+        "-NoPrompt",
+    ]
+    write_action_line("Running command: " + " ".join(cmd))
+    try:
+        return subprocess.run(cmd, check=False).returncode == 0
+    except Exception as e:
+        write_error_line(f"Failed to run the distributor: {e}")
+        return False
+
+
+# =====================================================================================
+# Function to run the whole pipeline
+# =====================================================================================
+def run_pipeline(config_file: str, epoch: dict, timerange: str, thresholds: dict,
+                 strategy_name: str, strategy_file: str):
+    log_line(
+        f"PIPELINE {strategy_name} epoch {epoch.get('current_epoch')} "
+        f"config {config_file} validation {timerange}"
+    )
+    pipeline_started = time.time()
+
+    with stage("Export parameters"):
+        params_file, backup_file = export_parameters(strategy_name, strategy_file, epoch)
+        write_info_line(f"Parameters written to {params_file}")
+
+    try:
+        with stage("Validation backtest"):
+            result = run_validation_backtest(config_file, strategy_name, timerange)
+    except Exception:
+        restore_parameters(params_file, backup_file)
+        raise
+
+    with stage("Acceptance check"):
+        accepted = bool(result) and check_thresholds(result, thresholds)
+
+    if not accepted:
+        if not result:
+            write_error_line("The validation backtest produced no result.")
+        restore_parameters(params_file, backup_file)
+        log_line(f"REJECTED {strategy_name} ({time.time() - pipeline_started:.1f}s)")
+        write_error_line("Thresholds not met. Nothing was deployed.")
+        return
+
+    if backup_file:
+        os.remove(backup_file)
+
+    with stage("Deploy"):
+        strategy_file_name = os.path.basename(strategy_file)
+        bots = get_mapped_bots(strategy_file_name)
+        if not bots:
+            write_warning_line(f"No bots mapped to {strategy_file_name} in the distribution file.")
+            deployed = False
+        else:
+            write_info_line(f"Deploying to: {', '.join(bots)}")
+            deployed = deploy_to_bots(
+                bots, [strategy_file_name, os.path.basename(params_file)]
+            )
+
+    total = time.time() - pipeline_started
+    log_line(f"{'DEPLOYED' if deployed else 'NOT DEPLOYED'} {strategy_name} ({total:.1f}s)")
+    if deployed:
+        write_tell(f"{strategy_name} promoted in {total:.0f}s.")
+    else:
+        write_error_line(f"{strategy_name} passed validation but was not deployed.")
+
+
+# =====================================================================================
+# Main flow
+# =====================================================================================
+def main():
+    ensure_working_directory()
+
+    while True:
+        config_file = get_config_file()
+        config = load_json_config(os.path.join(PROJECT_ROOT, *config_file.split("/")))
+        strategy_name = config.get("strategy")
+        strategy_file = find_strategy_file(strategy_name) if strategy_name else None
+
+        if not strategy_file:
+            write_error_line(f"Could not find the strategy of {config_file}.")
+        else:
+            epoch = select_hyperopt_epoch(strategy_name)
+            if epoch:
+                timerange = get_validation_timerange(epoch)
+                thresholds = get_thresholds()
+                run_pipeline(
+                    config_file, epoch, timerange, thresholds, strategy_name, strategy_file
+                )
+
+        write_action_line("Type 'new' (or 'n') to promote another strategy, or 'exit' (or 'e') to close this window")
+        user_input = input().strip().lower()
+        if user_input not in ("new", "n"):
+            write_info_line("Exiting...")
+            break
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,679 @@
+#!/usr/bin/env python
+import os
+import re
+import glob
+import json
+import sqlite3
+import subprocess
+import sys
+import time
+import zipfile
+from datetime import datetime
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+# =====================================================================================
+# Basic colored output (works in modern Windows terminals with ANSI support)
+# =====================================================================================
+RESET = "\033[0m"
+RED = "\033[31m"
+WHITE = "\033[37m"
+YELLOW = "\033[33m"
+GREEN = "\033[32m"
+BLUE = "\033[34m"
+
+
+def write_error_line(msg: str):
+    print(f"{RED}{msg}{RESET}")
+
+
+def write_info_line(msg: str):
+    print(f"{WHITE}{msg}{RESET}")
+
+
+def write_warning_line(msg: str):
+    print(f"{YELLOW}{msg}{RESET}")
+
+
+def write_action_line(msg: str):
+    print(f"{GREEN}{msg}{RESET}")
+
+
+def write_tell(msg: str):
+    print(f"{BLUE}{msg}{RESET}")
+
+
+# =====================================================================================
+# Config / path constants
+# =====================================================================================
+PROJECT_ROOT = r"K:\Freqtrade"
+BACKTEST_RESULTS_FOLDER = os.path.join(PROJECT_ROOT, "user_data", "backtest_results")
+HYPEROPT_RESULTS_FOLDER = os.path.join(PROJECT_ROOT, "user_data", "hyperopt_results")
+ARCHIVE_FOLDER = os.path.join(PROJECT_ROOT, "user_data", "result_archive")
+INDEX_DB = os.path.join(ARCHIVE_FOLDER, "index.sqlite")
+HISTORY_DB = os.path.join(PROJECT_ROOT, "user_data", "run_history.sqlite")
+
+# Results younger than this are left alone, they may still be written or inspected
+MIN_AGE_MINUTES = 10
+DEFAULT_KEEP_BEST = 5
+DEFAULT_EXPIRE_DAYS = 90
+COMPRESSION = "zstd"
+
+ARCHIVE_METADATA_KEY = b"ft_archive"
+
+
+def ensure_working_directory():
+    if os.getcwd().lower() != PROJECT_ROOT.lower():
+        write_warning_line(f"Switching to expected working directory: {PROJECT_ROOT}")
+        try:
+            os.chdir(PROJECT_ROOT)
+        except Exception as e:
+            write_error_line(f"Failed to change directory to {PROJECT_ROOT}. {e}")
+            sys.exit(1)
+
+
+# =====================================================================================
+# Index database
+# =====================================================================================
+def open_index() -> sqlite3.Connection:
+    os.makedirs(ARCHIVE_FOLDER, exist_ok=True)
+    conn = sqlite3.connect(INDEX_DB, timeout=30)
+    conn.row_factory = sqlite3.Row
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS results (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            run_id TEXT NOT NULL,
+            kind TEXT NOT NULL,
+            strategy TEXT,
+            config_file TEXT,
+            timerange TEXT,
+            created_at TEXT,
+            total_trades INTEGER,
+            profit_total REAL,
+            max_drawdown REAL,
+            loss REAL,
+            original_path TEXT NOT NULL,
+            archive_path TEXT NOT NULL,
+            size_before INTEGER,
+            size_after INTEGER
+        )
+        """
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS results_strategy ON results (strategy)")
+    conn.execute("CREATE INDEX IF NOT EXISTS results_run_id ON results (run_id)")
+    return conn
+
+
+def lookup_config_file(result_path: str):
+    """
+    Finds the config a result was produced with, from the run history.
+    """
+    if not os.path.exists(HISTORY_DB):
+        return None
+    name = os.path.basename(result_path)
+    try:
+        conn = sqlite3.connect(HISTORY_DB, timeout=30)
+        row = conn.execute(
+            "SELECT config_file FROM runs WHERE results LIKE ? ORDER BY id DESC LIMIT 1",
+            (f"%{name}%",),
+        ).fetchone()
+        conn.close()
+    except sqlite3.Error:
+        return None
+    return row[0] if row else None
+
+
+# =====================================================================================
+# Finding finished results
+# =====================================================================================
+def get_latest_results() -> set:
+    """
+    Results referenced by a .last_result.json stay in place so freqtrade's
+    *-show commands (and the scripts reading them) keep working.
+    """
+    latest = set()
+    for folder in (BACKTEST_RESULTS_FOLDER, HYPEROPT_RESULTS_FOLDER):
+        for marker in glob.glob(os.path.join(folder, "**", ".last_result.json"), recursive=True):
+            try:
+                with open(marker, "r", encoding="utf-8") as f:
+                    for name in json.load(f).values():
+                        latest.add(os.path.normcase(os.path.join(os.path.dirname(marker), name)))
+            except (OSError, ValueError):
+                continue
+    return latest
+
+
+def get_running_containers():
+    try:
+        out = subprocess.run(
+            ["docker", "ps", "--format", "{{.Names}}"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+    except Exception:
+        return None
+    return set(out.split())
+
+
+def get_live_run_starts() -> dict:
+    """
+    Start time of the oldest backtest / hyperopt run that is still going, per kind.
+    A run is live when it has no exit code yet and its container is still running;
+    if docker cannot be asked, every run without an exit code counts as live.
+    """
+    if not os.path.exists(HISTORY_DB):
+        return {}
+    try:
+        conn = sqlite3.connect(HISTORY_DB, timeout=30)
+        rows = conn.execute(
+            "SELECT kind, started_at, container FROM runs WHERE exit_code IS NULL"
+        ).fetchall()
+        conn.close()
+    except sqlite3.Error:
+        return {}
+
+    running = get_running_containers()
+    starts = {}
+    for kind, started_at, container in rows:
+        if running is not None and container not in running:
+            continue
+        started = datetime.strptime(started_at, "%Y-%m-%d %H:%M:%S").timestamp()
+        starts[kind] = min(starts.get(kind, started), started)
+    return starts
+
+
+def find_finished_results() -> list:
+    cutoff = time.time() - MIN_AGE_MINUTES * 60
+    latest = get_latest_results()
+    live_starts = get_live_run_starts()
+    for kind in live_starts:
+        write_warning_line(f"A {kind} run is still going; leaving its newer results in place.")
+    found = []
+
+    for path in glob.glob(os.path.join(BACKTEST_RESULTS_FOLDER, "**", "backtest-result-*"), recursive=True):
+        name = os.path.basename(path)
+        if not (name.endswith(".json") or name.endswith(".zip")):
+            continue
+        if name.endswith(".meta.json") or name.endswith("_config.json"):
+            continue
+        found.append(("backtest", path))
+
+    for path in glob.glob(os.path.join(HYPEROPT_RESULTS_FOLDER, "**", "*.fthypt"), recursive=True):
+        found.append(("hyperopt", path))
+
+    return [
+        (kind, path)
+        for kind, path in found
+        if os.path.getmtime(path) < min(cutoff, live_starts.get(kind, cutoff))
+        and os.path.normcase(path) not in latest
+    ]
+
+
+# =====================================================================================
+# Columnar conversion
+# =====================================================================================
+def rows_to_table(rows: list):
+    """
+    Builds an Arrow table from a list of dicts. Nested or mixed-type columns are
+    stored as JSON strings; their names are returned so they can be decoded again.
+    """
+    columns = list(dict.fromkeys(key for row in rows for key in row))
+    arrays, json_columns = [], []
+    for column in columns:
+        values = [row.get(column) for row in rows]
+        if any(isinstance(v, (list, dict)) for v in values):
+            array = None
+        else:
+            try:
+                array = pa.array(values)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                array = None
+        if array is None:
+            array = pa.array([json.dumps(v) for v in values], type=pa.string())
+            json_columns.append(column)
+        arrays.append(array)
+    return pa.table(dict(zip(columns, arrays))), json_columns
+
+
+def table_to_rows(table, json_columns: list) -> list:
+    rows = table.to_pylist()
+    for row in rows:
+        for column in json_columns:
+            if column in row:
+                row[column] = json.loads(row[column])
+    return rows
+
+
+def read_backtest_file(path: str):
+    """
+    Returns (result, extra_files). extra_files holds the other members of a
+    .zip result (config, strategy source, market change data).
+    """
+    if path.endswith(".zip"):
+        stem = os.path.splitext(os.path.basename(path))[0]
+        extras = {}
+        with zipfile.ZipFile(path) as zf:
+            result = json.loads(zf.read(f"{stem}.json"))
+            for member in zf.namelist():
+                if member != f"{stem}.json":
+                    extras[member] = zf.read(member)
+        return result, extras
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f), {}
+
+
+# =====================================================================================
+# Archiving
+# =====================================================================================
+def get_archive_path(kind: str, path: str, conn: sqlite3.Connection) -> str:
+    """
+    Archive name is the path below the results folder with separators replaced
+    by '__', so equal file names in different sub folders do not collide.
+    Refuses to overwrite an archive that belongs to another result.
+    """
+    folder = BACKTEST_RESULTS_FOLDER if kind == "backtest" else HYPEROPT_RESULTS_FOLDER
+    name = os.path.splitext(os.path.relpath(path, folder))[0].replace(os.sep, "__")
+    archive_path = os.path.join(ARCHIVE_FOLDER, kind, f"{name}.parquet")
+
+    if os.path.exists(archive_path):
+        row = conn.execute(
+            "SELECT 1 FROM results WHERE archive_path = ? AND original_path = ? LIMIT 1",
+            (os.path.relpath(archive_path, PROJECT_ROOT), os.path.relpath(path, PROJECT_ROOT)),
+        ).fetchone()
+        if row is None:
+            raise FileExistsError(f"{os.path.relpath(archive_path, PROJECT_ROOT)} holds another result")
+    os.makedirs(os.path.dirname(archive_path), exist_ok=True)
+    return archive_path
+
+
+def archive_backtest(path: str, conn: sqlite3.Connection) -> str:
+    result, extras = read_backtest_file(path)
+    name = os.path.basename(path)
+    stem = os.path.splitext(name)[0]
+
+    rows = []
+    skeleton = json.loads(json.dumps(result))
+    for strategy, data in skeleton.get("strategy", {}).items():
+        for trade in data.pop("trades", []) or []:
+            rows.append({"__strategy": strategy, **trade})
+    table, json_columns = rows_to_table(rows) if rows else (pa.table({}), [])
+
+    meta_path = os.path.splitext(path)[0] + ".meta.json"
+    meta = None
+    if os.path.exists(meta_path):
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+
+    archive_path = get_archive_path("backtest", path, conn)
+
+    metadata = {
+        "kind": "backtest",
+        "original_path": os.path.relpath(path, PROJECT_ROOT),
+        "container": "zip" if name.endswith(".zip") else "json",
+        "result": skeleton,
+        "json_columns": json_columns,
+        "meta": meta,
+    }
+    table = table.replace_schema_metadata({ARCHIVE_METADATA_KEY: json.dumps(metadata)})
+    pq.write_table(table, archive_path, compression=COMPRESSION)
+
+    if extras:
+        with zipfile.ZipFile(archive_path + ".extras.zip", "w", zipfile.ZIP_LZMA) as zf:
+            for member, data in extras.items():
+                zf.writestr(member, data)
+
+    config_file = lookup_config_file(path)
+    size_before = os.path.getsize(path) + (os.path.getsize(meta_path) if meta else 0)
+    size_after = os.path.getsize(archive_path) + (
+        os.path.getsize(archive_path + ".extras.zip") if extras else 0
+    )
+    # A restored result that is archived again replaces its own earlier index rows
+    conn.execute(
+        "DELETE FROM results WHERE archive_path = ? AND original_path = ?",
+        (os.path.relpath(archive_path, PROJECT_ROOT), metadata["original_path"]),
+    )
+    for strategy, data in result.get("strategy", {}).items():
+        timerange = data.get("timerange")
+        if not timerange and data.get("backtest_start"):
+            timerange = f"{str(data['backtest_start'])[:10]}-{str(data.get('backtest_end', ''))[:10]}"
+        conn.execute(
+            """
+            INSERT INTO results (run_id, kind, strategy, config_file, timerange, created_at,
+                total_trades, profit_total, max_drawdown, loss, original_path, archive_path,
+                size_before, size_after)
+            VALUES (?, 'backtest', ?, ?, ?, ?, ?, ?, ?, NULL, ?, ?, ?, ?)
+            """,
+            (
+                stem,
+                strategy,
+                config_file,
+                timerange,
+                datetime.fromtimestamp(os.path.getmtime(path)).strftime("%Y-%m-%d %H:%M:%S"),
+                data.get("total_trades"),
+                data.get("profit_total"),
+                data.get("max_drawdown_account"),
+                metadata["original_path"],
+                os.path.relpath(archive_path, PROJECT_ROOT),
+                size_before,
+                size_after,
+            ),
+        )
+
+    os.remove(path)
+    if meta:
+        os.remove(meta_path)
+    return archive_path
+
+
+def archive_hyperopt(path: str, conn: sqlite3.Connection) -> str:
+    with open(path, "r", encoding="utf-8") as f:
+        lines = [line.rstrip("\n") for line in f if line.strip()]
+    epochs = [json.loads(line) for line in lines]
+
+    name = os.path.basename(path)
+    stem = os.path.splitext(name)[0]
+    table = pa.table(
+        {
+            "current_epoch": pa.array([e.get("current_epoch") for e in epochs], type=pa.int64()),
+            "loss": pa.array([e.get("loss") for e in epochs], type=pa.float64()),
+            "is_best": pa.array([bool(e.get("is_best")) for e in epochs]),
+            "total_trades": pa.array(
+                [e.get("results_metrics", {}).get("total_trades") for e in epochs], type=pa.int64()
+            ),
+            "profit_total": pa.array(
+                [e.get("results_metrics", {}).get("profit_total") for e in epochs], type=pa.float64()
+            ),
+            # The original line, so the .fthypt file can be restored byte for byte
+            "raw": pa.array(lines, type=pa.string()),
+        }
+    )
+    metadata = {"kind": "hyperopt", "original_path": os.path.relpath(path, PROJECT_ROOT)}
+    table = table.replace_schema_metadata({ARCHIVE_METADATA_KEY: json.dumps(metadata)})
+
+    archive_path = get_archive_path("hyperopt", path, conn)
+    pq.write_table(table, archive_path, compression=COMPRESSION)
+
+    m = re.match(r"^strategy_(.+)_\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2}$", stem)
+    strategy = m.group(1) if m else None
+    best = min(epochs, key=lambda e: e.get("loss", float("inf"))) if epochs else {}
+    metrics = best.get("results_metrics", {})
+    timerange = None
+    if metrics.get("backtest_start"):
+        timerange = f"{str(metrics['backtest_start'])[:10]}-{str(metrics.get('backtest_end', ''))[:10]}"
+
+    conn.execute(
+        "DELETE FROM results WHERE archive_path = ? AND original_path = ?",
+        (os.path.relpath(archive_path, PROJECT_ROOT), metadata["original_path"]),
+    )
+    conn.execute(
+        """
+        INSERT INTO results (run_id, kind, strategy, config_file, timerange, created_at,
+            total_trades, profit_total, max_drawdown, loss, original_path, archive_path,
+            size_before, size_after)
+        VALUES (?, 'hyperopt', ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        (
+            stem,
+            strategy,
+            lookup_config_file(path),
+            timerange,
+            datetime.fromtimestamp(os.path.getmtime(path)).strftime("%Y-%m-%d %H:%M:%S"),
+            metrics.get("total_trades"),
+            metrics.get("profit_total"),
+            metrics.get("max_drawdown_account"),
+            best.get("loss"),
+            metadata["original_path"],
+            os.path.relpath(archive_path, PROJECT_ROOT),
+            os.path.getsize(path),
+            os.path.getsize(archive_path),
+        ),
+    )
+
+    os.remove(path)
+    return archive_path
+
+
+def archive_finished_results():
+    results = find_finished_results()
+    if not results:
+        write_tell("Nothing to archive.")
+        return
+
+    write_action_line(f"Archiving {len(results)} result file(s)...")
+    before = after = 0
+    conn = open_index()
+    for kind, path in results:
+        size = os.path.getsize(path)
+        try:
+            if kind == "backtest":
+                archive_path = archive_backtest(path, conn)
+            else:
+                archive_path = archive_hyperopt(path, conn)
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            write_error_line(f"Failed to archive {os.path.basename(path)}: {e}")
+            continue
+        before += size
+        after += os.path.getsize(archive_path)
+        write_info_line(f"{os.path.basename(path)} -> {os.path.relpath(archive_path, PROJECT_ROOT)}")
+    conn.close()
+
+    if before:
+        write_tell(f"Archived {before / 1024 ** 2:.1f}MB into {after / 1024 ** 2:.1f}MB.")
+
+
+# =====================================================================================
+# Restoring
+# =====================================================================================
+def restore_archive(archive_path: str, target_path: str = None) -> str:
+    """
+    Writes an archived result back in its original format (.json, .zip or
+    .fthypt) to its original location, or to target_path.
+    """
+    table = pq.read_table(archive_path)
+    metadata = json.loads(table.schema.metadata[ARCHIVE_METADATA_KEY])
+    target_path = target_path or os.path.join(PROJECT_ROOT, metadata["original_path"])
+    os.makedirs(os.path.dirname(target_path), exist_ok=True)
+
+    if metadata["kind"] == "hyperopt":
+        with open(target_path, "w", encoding="utf-8") as f:
+            for line in table.column("raw").to_pylist():
+                f.write(line + "\n")
+        return target_path
+
+    result = metadata["result"]
+    for strategy in result.get("strategy", {}).values():
+        strategy["trades"] = []
+    for row in table_to_rows(table, metadata["json_columns"]):
+        strategy = row.pop("__strategy")
+        result["strategy"][strategy]["trades"].append(row)
+
+    stem = os.path.splitext(os.path.basename(target_path))[0]
+    if metadata["container"] == "zip":
+        with zipfile.ZipFile(target_path, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr(f"{stem}.json", json.dumps(result))
+            extras_path = archive_path + ".extras.zip"
+            if os.path.exists(extras_path):
+                with zipfile.ZipFile(extras_path) as extras:
+                    for member in extras.namelist():
+                        zf.writestr(member, extras.read(member))
+    else:
+        with open(target_path, "w", encoding="utf-8") as f:
+            json.dump(result, f)
+
+    if metadata.get("meta") is not None:
+        with open(os.path.splitext(target_path)[0] + ".meta.json", "w", encoding="utf-8") as f:
+            json.dump(metadata["meta"], f)
+    return target_path
+
+
+def load_archived_hyperopt_epochs(strategy_name: str) -> list:
+    """
+    Returns (file name, epochs) for every archived hyperopt run of a strategy,
+    so warm starts can still use results that were moved out of hyperopt_results.
+    """
+    if pa is None or not os.path.exists(INDEX_DB):
+        return []
+    conn = open_index()
+    rows = conn.execute(
+        "SELECT run_id, archive_path FROM results WHERE kind = 'hyperopt' AND strategy = ?",
+        (strategy_name,),
+    ).fetchall()
+    conn.close()
+
+    runs = []
+    for row in rows:
+        path = os.path.join(PROJECT_ROOT, row["archive_path"])
+        try:
+            raw = pq.read_table(path, columns=["raw"]).column("raw").to_pylist()
+        except Exception:
+            continue
+        runs.append((f"{row['run_id']}.fthypt", [json.loads(line) for line in raw]))
+    return runs
+
+
+# =====================================================================================
+# Retention
+# =====================================================================================
+def apply_retention(keep_best: int, expire_days: int):
+    """
+    Deletes archives older than expire_days, unless they hold one of the
+    keep_best results of a strategy (highest profit for backtests, lowest
+    loss for hyperopts).
+    """
+    conn = open_index()
+    protected = set()
+    for kind, order in (("backtest", "profit_total DESC"), ("hyperopt", "loss ASC")):
+        strategies = [
+            r["strategy"]
+            for r in conn.execute(
+                "SELECT DISTINCT strategy FROM results WHERE kind = ?", (kind,)
+            ).fetchall()
+        ]
+        for strategy in strategies:
+            for r in conn.execute(
+                f"SELECT archive_path FROM results WHERE kind = ? AND strategy IS ? "
+                f"ORDER BY {order} LIMIT ?",
+                (kind, strategy, keep_best),
+            ).fetchall():
+                protected.add(r["archive_path"])
+
+    expired = conn.execute(
+        "SELECT DISTINCT archive_path FROM results WHERE created_at < datetime('now', 'localtime', ?)",
+        (f"-{expire_days} days",),
+    ).fetchall()
+
+    removed = 0
+    for r in expired:
+        archive_path = r["archive_path"]
+        if archive_path in protected:
+            continue
+        for path in (archive_path, archive_path + ".extras.zip"):
+            full_path = os.path.join(PROJECT_ROOT, path)
+            if os.path.exists(full_path):
+                os.remove(full_path)
+        conn.execute("DELETE FROM results WHERE archive_path = ?", (archive_path,))
+        removed += 1
+    conn.commit()
+    conn.close()
+    write_tell(f"Retention removed {removed} archive(s), {len(protected)} protected as best results.")
+
+
+# =====================================================================================
+# Queries
+# =====================================================================================
+def list_results(strategy: str = None, limit: int = 30):
+    conn = open_index()
+    if strategy:
+        rows = conn.execute(
+            "SELECT * FROM results WHERE strategy LIKE ? ORDER BY created_at DESC LIMIT ?",
+            (f"%{strategy}%", limit),
+        ).fetchall()
+    else:
+        rows = conn.execute(
+            "SELECT * FROM results ORDER BY created_at DESC LIMIT ?", (limit,)
+        ).fetchall()
+    conn.close()
+
+    if not rows:
+        write_warning_line("No archived results found.")
+        return
+    for r in reversed(rows):
+        profit = f"{r['profit_total']:.2%}" if r["profit_total"] is not None else "-"
+        loss = f"loss={r['loss']:.4f}" if r["loss"] is not None else ""
+        write_info_line(
+            f"#{r['id']:<5} {r['created_at']}  {r['kind']:<8} {r['strategy'] or '-':<25} "
+            f"{r['config_file'] or '-':<24} {r['timerange'] or '-':<21} "
+            f"trades={r['total_trades'] or 0:<5} profit={profit:<8} {loss}"
+        )
+
+
+def restore_by_id(index_id: int):
+    conn = open_index()
+    row = conn.execute("SELECT * FROM results WHERE id = ?", (index_id,)).fetchone()
+    conn.close()
+    if row is None:
+        write_error_line(f"No archived result with id {index_id}.")
+        return
+    target = restore_archive(os.path.join(PROJECT_ROOT, row["archive_path"]))
+    write_tell(f"Restored to {target}")
+
+
+# =====================================================================================
+# Main flow
+# =====================================================================================
+def get_positive_int(prompt: str, default: int) -> int:
+    while True:
+        write_action_line(f"{prompt} (default {default}):")
+        value = input().strip()
+        if not value:
+            return default
+        if value.isdigit() and int(value) > 0:
+            return int(value)
+        write_error_line("Invalid input. Please enter a positive integer.")
+
+
+def main():
+    if pa is None:
+        write_error_line("This script needs pyarrow: pip install pyarrow")
+        sys.exit(1)
+
+    ensure_working_directory()
+
+    while True:
+        write_action_line(
+            "Type 'archive' (a), 'list' (l), 'restore' (r), 'retention' (p) or 'exit' (e)"
+        )
+        user_input = input().strip().lower()
+
+        if user_input in ("archive", "a"):
+            archive_finished_results()
+        elif user_input in ("list", "l"):
+            strategy = input("Filter by strategy (Enter = all): ").strip()
+            list_results(strategy or None)
+        elif user_input in ("restore", "r"):
+            index_id = input("Enter the result id to restore: ").strip()
+            if index_id.isdigit():
+                restore_by_id(int(index_id))
+            else:
+                write_error_line("Invalid input. Please enter a result id.")
+        elif user_input in ("retention", "p"):
+            keep_best = get_positive_int("Keep the best N results per strategy", DEFAULT_KEEP_BEST)
+            expire_days = get_positive_int("Expire other results older than (days)", DEFAULT_EXPIRE_DAYS)
+            apply_retention(keep_best, expire_days)
+        elif user_input in ("exit", "e"):
+            write_info_line("Exiting...")
+            break
+        else:
+            write_error_line("Invalid input. Please type 'archive', 'list', 'restore', 'retention' or 'exit'.")
+
+
+if __name__ == "__main__":
+    main()
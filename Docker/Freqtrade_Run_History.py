@@ -0,0 +1,704 @@
+#!/usr/bin/env python
+import os
+import re
+import copy
+import glob
+import hashlib
+import json
+import sqlite3
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import zipfile
+from datetime import datetime
+
+# =====================================================================================
+# Basic colored output (works in modern Windows terminals with ANSI support)
+# =====================================================================================
+RESET = "\033[0m"
+RED = "\033[31m"
+WHITE = "\033[37m"
+YELLOW = "\033[33m"
+GREEN = "\033[32m"
+BLUE = "\033[34m"
+
+
+def write_error_line(msg: str):
+    print(f"{RED}{msg}{RESET}")
+
+
+def write_info_line(msg: str):
+    print(f"{WHITE}{msg}{RESET}")
+
+
+def write_warning_line(msg: str):
+    print(f"{YELLOW}{msg}{RESET}")
+
+
+def write_action_line(msg: str):
+    print(f"{GREEN}{msg}{RESET}")
+
+
+def write_tell(msg: str):
+    print(f"{BLUE}{msg}{RESET}")
+
+
+# =====================================================================================
+# Config / path constants
+# =====================================================================================
+PROJECT_ROOT = r"K:\Freqtrade"
+STRATEGIES_FOLDER = os.path.join(PROJECT_ROOT, "user_data", "strategies")
+BACKTEST_RESULTS_FOLDER = os.path.join(PROJECT_ROOT, "user_data", "backtest_results")
+HYPEROPT_RESULTS_FOLDER = os.path.join(PROJECT_ROOT, "user_data", "hyperopt_results")
+HISTORY_DB = os.path.join(PROJECT_ROOT, "user_data", "run_history.sqlite")
+
+MEMORY_POLL_SECONDS = 2
+# A run is flagged when it is this much slower / bigger than the median of similar runs
+REGRESSION_THRESHOLD = 1.25
+REGRESSION_MIN_HISTORY = 2
+# Options whose value changes on every run (timestamped folders like batch_*, promote_*, pipeline_*)
+SIGNATURE_IGNORED_OPTIONS = ("--name", "--export-filename", "--strategy-path")
+
+
+def ensure_working_directory():
+    if os.getcwd().lower() != PROJECT_ROOT.lower():
+        write_warning_line(f"Switching to expected working directory: {PROJECT_ROOT}")
+        try:
+            os.chdir(PROJECT_ROOT)
+        except Exception as e:
+            write_error_line(f"Failed to change directory to {PROJECT_ROOT}. {e}")
+            sys.exit(1)
+
+
+# =====================================================================================
+# History database
+# =====================================================================================
+def open_history() -> sqlite3.Connection:
+    conn = sqlite3.connect(HISTORY_DB, timeout=30)
+    conn.row_factory = sqlite3.Row
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS runs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            kind TEXT NOT NULL,
+            started_at TEXT NOT NULL,
+            command TEXT NOT NULL,
+            container TEXT,
+            signature TEXT NOT NULL,
+            config_file TEXT,
+            config_hash TEXT,
+            strategy TEXT,
+            strategy_hash TEXT,
+            timerange TEXT,
+            workers INTEGER,
+            wall_time REAL,
+            exit_code INTEGER,
+            peak_memory_mb REAL,
+            results TEXT
+        )
+        """
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS runs_signature ON runs (signature)")
+    return conn
+
+
+def file_hash(path: str):
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()[:16]
+    except OSError:
+        return None
+
+
+def get_option(cmd: list, option: str):
+    if option in cmd and cmd.index(option) + 1 < len(cmd):
+        return cmd[cmd.index(option) + 1]
+    return None
+
+
+def build_signature(kind: str, cmd: list, config_hash, strategy_hash) -> str:
+    """
+    Runs with the same signature are "similar jobs": same command (apart from
+    the container name and the per-run output/strategy folders) on the same
+    config and strategy source.
+    """
+    args = list(cmd)
+    for option in SIGNATURE_IGNORED_OPTIONS:
+        if option in args:
+            index = args.index(option)
+            del args[index:index + 2]
+    key = json.dumps([kind, args, config_hash, strategy_hash])
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+
+
+# =====================================================================================
+# Shared file helpers (also used by the backtest, hyperopt and promote scripts)
+# =====================================================================================
+def strip_json_comments(content: str) -> str:
+    """
+    Removes // and /* */ comments that are outside of strings, including the
+    ones at the end of a line.
+    """
+    out = []
+    index = 0
+    while index < len(content):
+        if content[index] == '"':
+            end = index + 1
+            while end < len(content) and content[end] != '"':
+                end += 2 if content[end] == "\\" else 1
+            out.append(content[index:end + 1])
+            index = end + 1
+        elif content.startswith("//", index):
+            end = content.find("\n", index)
+            index = len(content) if end == -1 else end
+        elif content.startswith("/*", index):
+            end = content.find("*/", index + 2)
+            index = len(content) if end == -1 else end + 2
+        else:
+            out.append(content[index])
+            index += 1
+    return "".join(out)
+
+
+def load_json_config(path: str) -> dict:
+    """
+    Loads a freqtrade config from the host. Freqtrade allows comments,
+    so those are stripped before parsing.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        content = f.read()
+    return json.loads(strip_json_comments(content))
+
+
+def get_config_strategy(config_path: str):
+    try:
+        return load_json_config(config_path).get("strategy")
+    except Exception as e:
+        write_warning_line(f"Could not read the strategy from {config_path}: {e}")
+        return None
+
+
+def find_strategy_file(strategy_name: str):
+    pattern = re.compile(rf"class\s+{re.escape(strategy_name)}\s*\(")
+    for path in sorted(glob.glob(os.path.join(STRATEGIES_FOLDER, "*.py"))):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                if pattern.search(f.read()):
+                    return path
+        except Exception:
+            continue
+    return None
+
+
+def get_strategy_timeframe(strategy_name: str):
+    class_pattern = re.compile(rf"class\s+{re.escape(strategy_name)}\s*\(")
+    timeframe_pattern = re.compile(r"^\s+timeframe\s*=\s*[\"'](\w+)[\"']", re.MULTILINE)
+    for path in sorted(glob.glob(os.path.join(STRATEGIES_FOLDER, "*.py"))):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                content = f.read()
+        except Exception:
+            continue
+        m = class_pattern.search(content)
+        if m:
+            tf = timeframe_pattern.search(content, m.end())
+            return tf.group(1) if tf else None
+    return None
+
+
+def load_hyperopt_epochs(result_file: str) -> list:
+    epochs = []
+    with open(result_file, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                epochs.append(json.loads(line))
+    return epochs
+
+
+def load_backtest_result(export_dir: str):
+    """
+    Reads the result that freqtrade wrote into export_dir, whether it was
+    stored as a plain .json (older versions) or inside a .zip (newer versions).
+    Returns (result_path, result), or (None, None) when there is none.
+    """
+    try:
+        with open(os.path.join(export_dir, ".last_result.json"), "r", encoding="utf-8") as f:
+            latest = json.load(f)["latest_backtest"]
+    except Exception:
+        return None, None
+
+    result_path = os.path.join(export_dir, latest)
+    try:
+        if result_path.endswith(".zip"):
+            member = os.path.splitext(latest)[0] + ".json"
+            with zipfile.ZipFile(result_path) as zf:
+                return result_path, json.loads(zf.read(member))
+        with open(result_path, "r", encoding="utf-8") as f:
+            return result_path, json.load(f)
+    except Exception as e:
+        write_error_line(f"Failed to read backtest result {result_path}: {e}")
+        return None, None
+
+
+def merge_parameters(source: dict, destination: dict) -> dict:
+    """
+    Merges source into destination, nested dicts key by key (like freqtrade's deep_merge_dicts).
+    """
+    for key, value in source.items():
+        if isinstance(value, dict):
+            merge_parameters(value, destination.setdefault(key, {}))
+        else:
+            destination[key] = value
+    return destination
+
+
+def get_epoch_parameters(epoch: dict) -> dict:
+    """
+    All parameters of a hyperopt epoch, as `freqtrade hyperopt-show --print-json`
+    exports them: the optimized values merged over the ones that were not optimized.
+    """
+    return merge_parameters(
+        epoch.get("params_details", {}),
+        copy.deepcopy(epoch.get("params_not_optimized", {})),
+    )
+
+
+# =====================================================================================
+# Peak memory sampling (docker stats while the container runs)
+# =====================================================================================
+def parse_memory_mb(usage: str):
+    m = re.match(r"\s*([\d.]+)\s*([KMGT]?i?B)", usage)
+    if not m:
+        return None
+    factors = {
+        "B": 1 / 1024 ** 2,
+        "KiB": 1 / 1024,
+        "KB": 1 / 1024,
+        "MiB": 1,
+        "MB": 1,
+        "GiB": 1024,
+        "GB": 1024,
+        "TiB": 1024 ** 2,
+        "TB": 1024 ** 2,
+    }
+    return float(m.group(1)) * factors.get(m.group(2), 1)
+
+
+class MemorySampler(threading.Thread):
+    def __init__(self, container_name: str):
+        super().__init__(daemon=True)
+        self.container_name = container_name
+        self.peak_mb = None
+        self.stop_event = threading.Event()
+
+    def run(self):
+        while not self.stop_event.is_set():
+            try:
+                out = subprocess.run(
+                    [
+                        "docker",
+                        "stats",
+                        "--no-stream",
+                        "--format",
+                        "{{.MemUsage}}",
+                        self.container_name,
+                    ],
+                    capture_output=True,
+                    text=True,
+                    check=False,
+                ).stdout
+            except Exception:
+                return
+            usage = parse_memory_mb(out) if out else None
+            if usage is not None and (self.peak_mb is None or usage > self.peak_mb):
+                self.peak_mb = usage
+            self.stop_event.wait(MEMORY_POLL_SECONDS)
+
+    def stop(self):
+        self.stop_event.set()
+        self.join(timeout=MEMORY_POLL_SECONDS * 5)
+
+
+# =====================================================================================
+# Headline results of a finished run
+# =====================================================================================
+def collect_results(kind: str, cmd: list, started: float) -> dict:
+    if kind == "backtest":
+        export = get_option(cmd, "--export-filename")
+        export_dir = (
+            os.path.join(PROJECT_ROOT, *export.split("/")) if export else BACKTEST_RESULTS_FOLDER
+        )
+        result_path, result = load_backtest_result(export_dir)
+        if not result or os.path.getmtime(result_path) < started:
+            return {}
+        return {
+            "result_file": os.path.relpath(result_path, PROJECT_ROOT),
+            "strategies": {
+                name: {
+                    "total_trades": data.get("total_trades"),
+                    "profit_total": data.get("profit_total"),
+                    "max_drawdown_account": data.get("max_drawdown_account"),
+                }
+                for name, data in result.get("strategy", {}).items()
+            },
+        }
+
+    if kind == "hyperopt":
+        try:
+            with open(os.path.join(HYPEROPT_RESULTS_FOLDER, ".last_result.json"), "r", encoding="utf-8") as f:
+                latest = json.load(f)["latest_hyperopt"]
+            result_path = os.path.join(HYPEROPT_RESULTS_FOLDER, latest)
+            if os.path.getmtime(result_path) < started:
+                return {}
+            best = None
+            with open(result_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        epoch = json.loads(line)
+                        if best is None or epoch["loss"] < best["loss"]:
+                            best = epoch
+        except Exception:
+            return {}
+        if not best:
+            return {}
+        metrics = best.get("results_metrics", {})
+        return {
+            "result_file": os.path.relpath(result_path, PROJECT_ROOT),
+            "best_epoch": best.get("current_epoch"),
+            "best_loss": best.get("loss"),
+            "total_trades": metrics.get("total_trades"),
+            "profit_total": metrics.get("profit_total"),
+        }
+
+    return {}
+
+
+# =====================================================================================
+# Function to run a docker command and record it in the history
+# =====================================================================================
+def run_recorded(
+    kind: str,
+    cmd: list,
+    container_name: str,
+    config_file: str = None,
+    timerange: str = None,
+    workers: int = None,
+    on_output=None,
+    on_exit=None,
+):
+    """
+    Runs cmd like subprocess.run and stores the launch with its wall time,
+    exit status, peak container memory and headline results. Returns the run id.
+    The row is inserted at launch with no exit code, so other scripts can see
+    that the run is still going, and completed when the command ends.
+
+    When on_output is given, the combined stdout/stderr is streamed line by
+    line: each line is echoed and passed to on_output as it arrives.
+    on_exit is called with the exit code (None if the command could not run)
+    as soon as the command ends, before the run is recorded.
+    """
+    config_hash = strategy = strategy_hash = None
+    if config_file:
+        config_path = os.path.join(PROJECT_ROOT, *config_file.split("/"))
+        config_hash = file_hash(config_path)
+        strategy = get_config_strategy(config_path)
+        strategy_file = find_strategy_file(strategy) if strategy else None
+        strategy_hash = file_hash(strategy_file) if strategy_file else None
+
+    started_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    run_id = None
+    try:
+        with open_history() as conn:
+            run_id = conn.execute(
+                """
+                INSERT INTO runs (kind, started_at, command, container, signature,
+                    config_file, config_hash, strategy, strategy_hash, timerange, workers)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    kind,
+                    started_at,
+                    json.dumps(cmd),
+                    container_name,
+                    build_signature(kind, cmd, config_hash, strategy_hash),
+                    config_file,
+                    config_hash,
+                    strategy,
+                    strategy_hash,
+                    timerange,
+                    workers,
+                ),
+            ).lastrowid
+        conn.close()
+    except Exception as e:
+        write_error_line(f"Failed to record run in {HISTORY_DB}: {e}")
+
+    started = time.time()
+    sampler = MemorySampler(container_name)
+    sampler.start()
+
+    exit_code = None
+    try:
+        if on_output is None:
+            exit_code = subprocess.run(cmd, check=False).returncode
+        else:
+            process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+                bufsize=1,
+            )
+            for line in process.stdout:
+                sys.stdout.write(line)
+                sys.stdout.flush()
+                on_output(line)
+            exit_code = process.wait()
+    except Exception as e:
+        write_error_line(f"Failed to run docker command: {e}")
+    finally:
+        sampler.stop()
+        if on_exit is not None:
+            on_exit(exit_code)
+
+    wall_time = time.time() - started
+    if run_id is None:
+        return None
+
+    try:
+        results = collect_results(kind, cmd, started)
+        with open_history() as conn:
+            conn.execute(
+                """
+                UPDATE runs SET wall_time = ?, exit_code = ?, peak_memory_mb = ?, results = ?
+                WHERE id = ?
+                """,
+                (wall_time, exit_code, sampler.peak_mb, json.dumps(results), run_id),
+            )
+        conn.close()
+    except Exception as e:
+        write_error_line(f"Failed to record run in {HISTORY_DB}: {e}")
+        return None
+
+    write_tell(f"Run #{run_id} recorded ({wall_time:.0f}s, exit code {exit_code}).")
+    for message in find_regressions(run_id):
+        write_warning_line(message)
+    return run_id
+
+
+# =====================================================================================
+# Queries
+# =====================================================================================
+def get_run(conn: sqlite3.Connection, run_id: int):
+    return conn.execute("SELECT * FROM runs WHERE id = ?", (run_id,)).fetchone()
+
+
+def find_regressions(run_id: int) -> list:
+    """
+    Compares a run against the median of earlier successful runs with the
+    same signature and returns a message for each regression found.
+    """
+    history = []
+    with open_history() as conn:
+        run = get_run(conn, run_id)
+        if run is not None and run["exit_code"] == 0:
+            history = conn.execute(
+                """
+                SELECT wall_time, peak_memory_mb FROM runs
+                WHERE signature = ? AND id < ? AND exit_code = 0
+                """,
+                (run["signature"], run_id),
+            ).fetchall()
+    conn.close()
+
+    if len(history) < REGRESSION_MIN_HISTORY:
+        return []
+
+    messages = []
+    median_time = statistics.median(h["wall_time"] for h in history)
+    if median_time and run["wall_time"] > median_time * REGRESSION_THRESHOLD:
+        messages.append(
+            f"Run #{run_id} runtime regression: {run['wall_time']:.0f}s vs median "
+            f"{median_time:.0f}s of {len(history)} similar run(s)."
+        )
+
+    memories = [h["peak_memory_mb"] for h in history if h["peak_memory_mb"]]
+    if memories and run["peak_memory_mb"]:
+        median_memory = statistics.median(memories)
+        if run["peak_memory_mb"] > median_memory * REGRESSION_THRESHOLD:
+            messages.append(
+                f"Run #{run_id} memory regression: {run['peak_memory_mb']:.0f}MB vs median "
+                f"{median_memory:.0f}MB of {len(memories)} similar run(s)."
+            )
+    return messages
+
+
+def format_run(run) -> str:
+    peak = f"{run['peak_memory_mb']:.0f}MB" if run["peak_memory_mb"] else "-"
+    wall = f"{run['wall_time']:.0f}s" if run["wall_time"] is not None else "-"
+    return (
+        f"#{run['id']:<5} {run['started_at']}  {run['kind']:<9} "
+        f"{run['strategy'] or '-':<25} {run['timerange'] or '-':<18} "
+        f"j={run['workers'] or '-':<3} {wall:>7} {peak:>8}  exit={run['exit_code']}"
+    )
+
+
+def list_runs(limit: int = 20):
+    with open_history() as conn:
+        runs = conn.execute(
+            "SELECT * FROM runs ORDER BY id DESC LIMIT ?", (limit,)
+        ).fetchall()
+    conn.close()
+
+    if not runs:
+        write_warning_line("No runs recorded yet.")
+        return
+    for run in reversed(runs):
+        write_info_line(format_run(run))
+
+
+def show_run(run_id: int):
+    with open_history() as conn:
+        run = get_run(conn, run_id)
+    conn.close()
+
+    if run is None:
+        write_error_line(f"No run with id {run_id}.")
+        return
+    write_info_line(format_run(run))
+    write_info_line("Command: " + " ".join(json.loads(run["command"])))
+    write_info_line(f"Config: {run['config_file']} ({run['config_hash']})")
+    write_info_line(f"Strategy: {run['strategy']} ({run['strategy_hash']})")
+    write_info_line("Results: " + json.dumps(json.loads(run["results"] or "{}"), indent=4))
+
+
+def compare_runs(run_ids: list):
+    with open_history() as conn:
+        runs = [get_run(conn, run_id) for run_id in run_ids]
+    conn.close()
+
+    if any(run is None for run in runs):
+        write_error_line("One or more run ids do not exist.")
+        return
+
+    fields = [
+        "kind",
+        "started_at",
+        "config_file",
+        "config_hash",
+        "strategy",
+        "strategy_hash",
+        "timerange",
+        "workers",
+        "wall_time",
+        "peak_memory_mb",
+        "exit_code",
+    ]
+    write_action_line(f"{'':<16}" + "".join(f"#{run['id']:<24}" for run in runs))
+    for field in fields:
+        values = [run[field] for run in runs]
+        line = f"{field:<16}" + "".join(
+            f"{(f'{v:.1f}' if isinstance(v, float) else str(v)):<25}" for v in values
+        )
+        if len(set(values)) > 1:
+            write_warning_line(line)
+        else:
+            write_info_line(line)
+
+    results = [json.loads(run["results"] or "{}") for run in runs]
+    for run, result in zip(runs, results):
+        write_info_line(f"#{run['id']} results: {json.dumps(result)}")
+
+
+def list_regressions(limit: int = 100):
+    with open_history() as conn:
+        run_ids = [
+            row["id"]
+            for row in conn.execute(
+                "SELECT id FROM runs ORDER BY id DESC LIMIT ?", (limit,)
+            ).fetchall()
+        ]
+    conn.close()
+
+    found = False
+    for run_id in reversed(run_ids):
+        for message in find_regressions(run_id):
+            write_warning_line(message)
+            found = True
+    if not found:
+        write_tell(f"No regressions in the last {len(run_ids)} run(s).")
+
+
+def rerun(run_id: int):
+    with open_history() as conn:
+        run = get_run(conn, run_id)
+    conn.close()
+
+    if run is None:
+        write_error_line(f"No run with id {run_id}.")
+        return
+
+    ensure_working_directory()
+    cmd = json.loads(run["command"])
+    write_action_line("Running command: " + " ".join(cmd))
+    run_recorded(
+        run["kind"],
+        cmd,
+        run["container"],
+        run["config_file"],
+        run["timerange"],
+        run["workers"],
+    )
+
+
+# =====================================================================================
+# Function to get run ids from the user
+# =====================================================================================
+def get_run_ids(prompt: str, count: int = None) -> list:
+    while True:
+        write_action_line(prompt)
+        ids = input().strip().split()
+        if ids and all(i.isdigit() for i in ids) and (count is None or len(ids) >= count):
+            return [int(i) for i in ids]
+        write_error_line("Invalid input. Please enter run id number(s) separated by spaces.")
+
+
+# =====================================================================================
+# Main flow
+# =====================================================================================
+def main():
+    ensure_working_directory()
+
+    while True:
+        write_action_line(
+            "Type 'list' (l), 'show' (s), 'rerun' (r), 'compare' (c), "
+            "'regressions' (g) or 'exit' (e)"
+        )
+        user_input = input().strip().lower()
+
+        if user_input in ("list", "l"):
+            list_runs()
+        elif user_input in ("show", "s"):
+            for run_id in get_run_ids("Enter the run id:"):
+                show_run(run_id)
+        elif user_input in ("rerun", "r"):
+            run_id = get_run_ids("Enter the run id to re-run:")[0]
+            rerun(run_id)
+        elif user_input in ("compare", "c"):
+            compare_runs(get_run_ids("Enter two or more run ids separated by space:", 2))
+        elif user_input in ("regressions", "g"):
+            list_regressions()
+        elif user_input in ("exit", "e"):
+            write_info_line("Exiting...")
+            break
+        else:
+            write_error_line("Invalid input. Please type 'list', 'show', 'rerun', 'compare', 'regressions' or 'exit'.")
+
+
+if __name__ == "__main__":
+    main()
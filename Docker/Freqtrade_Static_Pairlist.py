@@ -0,0 +1,490 @@
+#!/usr/bin/env python
+import os
+import re
+import glob
+import json
+import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+try:
+    import numpy as np
+    import pyarrow.feather as feather
+except ImportError:
+    np = None
+
+from Freqtrade_Data_Integrity import read_dates_ms
+from Freqtrade_Run_History import load_json_config
+
+# =====================================================================================
+# Basic colored output (works in modern Windows terminals with ANSI support)
+# =====================================================================================
+RESET = "\033[0m"
+RED = "\033[31m"
+WHITE = "\033[37m"
+YELLOW = "\033[33m"
+GREEN = "\033[32m"
+BLUE = "\033[34m"
+
+
+def write_error_line(msg: str):
+    print(f"{RED}{msg}{RESET}")
+
+
+def write_info_line(msg: str):
+    print(f"{WHITE}{msg}{RESET}")
+
+
+def write_warning_line(msg: str):
+    print(f"{YELLOW}{msg}{RESET}")
+
+
+def write_action_line(msg: str):
+    print(f"{GREEN}{msg}{RESET}")
+
+
+def write_tell(msg: str):
+    print(f"{BLUE}{msg}{RESET}")
+
+
+# =====================================================================================
+# Config / path constants
+# =====================================================================================
+PROJECT_ROOT = r"K:\Freqtrade"
+CONFIG_FOLDER = "user_data"
+EXCHANGE = "kucoin"
+DATA_FOLDER = os.path.join(PROJECT_ROOT, "user_data", "data", EXCHANGE)
+PAIRLISTS_FOLDER = os.path.join(PROJECT_ROOT, "user_data", "pairlists")
+
+# Default ranking parameters (similar to a VolumePairList + AgeFilter + PriceFilter setup)
+DEFAULT_TIMEFRAME = "1h"
+DEFAULT_LOOKBACK_DAYS = 30
+DEFAULT_NUMBER_ASSETS = 50
+DEFAULT_MIN_AGE_DAYS = 30
+DEFAULT_MIN_PRICE = 0.0
+DEFAULT_MIN_VOLATILITY = 0.0
+DEFAULT_MAX_VOLATILITY = 1.0  # std of candle log returns over the lookback
+DEFAULT_WINDOW_DAYS = 30
+
+DAY_MS = 86_400_000
+
+
+def ensure_working_directory():
+    if os.getcwd().lower() != PROJECT_ROOT.lower():
+        write_warning_line(f"Switching to expected working directory: {PROJECT_ROOT}")
+        try:
+            os.chdir(PROJECT_ROOT)
+        except Exception as e:
+            write_error_line(f"Failed to change directory to {PROJECT_ROOT}. {e}")
+            sys.exit(1)
+
+
+# =====================================================================================
+# Input helpers
+# =====================================================================================
+def get_number(prompt: str, default, cast=float):
+    while True:
+        write_action_line(f"{prompt} (default {default}):")
+        value = input().strip()
+        if not value:
+            return default
+        try:
+            number = cast(value)
+        except ValueError:
+            number = None
+        if number is not None and number >= 0:
+            return number
+        write_error_line("Invalid input. Please enter a non-negative number.")
+
+
+def get_timeframe() -> str:
+    while True:
+        write_action_line(f"Enter the data timeframe to rank with (default {DEFAULT_TIMEFRAME}):")
+        timeframe = input().strip().lower() or DEFAULT_TIMEFRAME
+        if glob.glob(os.path.join(DATA_FOLDER, f"*-{timeframe}.feather")):
+            return timeframe
+        write_error_line(f"No {timeframe} feather files found in {DATA_FOLDER}.")
+
+
+def get_timerange() -> str:
+    pattern = re.compile(r"^\d{8}-\d{8}$")
+    while True:
+        write_action_line(
+            "Enter the backtest timerange to split into windows (format: YYYYMMDD-YYYYMMDD):"
+        )
+        timerange = input().strip()
+        if pattern.match(timerange):
+            return timerange
+        write_error_line(
+            "Invalid input. Please enter the timerange in the format YYYYMMDD-YYYYMMDD."
+        )
+
+
+def get_settings() -> dict:
+    return {
+        "timeframe": get_timeframe(),
+        "lookback_days": get_number("Lookback window in days", DEFAULT_LOOKBACK_DAYS, int),
+        "number_assets": get_number("Number of pairs to keep", DEFAULT_NUMBER_ASSETS, int),
+        "min_age_days": get_number("Minimum pair age in days", DEFAULT_MIN_AGE_DAYS, int),
+        "min_price": get_number("Minimum price", DEFAULT_MIN_PRICE),
+        "min_volatility": get_number("Minimum volatility", DEFAULT_MIN_VOLATILITY),
+        "max_volatility": get_number("Maximum volatility", DEFAULT_MAX_VOLATILITY),
+    }
+
+
+def select_configs() -> list:
+    config_files = sorted(
+        glob.glob(os.path.join(PROJECT_ROOT, CONFIG_FOLDER, "config-*.json"))
+    )
+    if not config_files:
+        write_error_line(f"No config-*.json files found in '{CONFIG_FOLDER}'.")
+        return []
+
+    while True:
+        write_action_line("Available Configs:")
+        for index, cfg in enumerate(config_files, start=1):
+            write_info_line(f"{index}. {os.path.basename(cfg)}")
+        choice = input("Enter the configs to update (e.g. 1 3 4, or 'all'): ").strip().lower()
+        if choice == "all":
+            return config_files
+        numbers = choice.split()
+        if numbers and all(n.isdigit() and 1 <= int(n) <= len(config_files) for n in numbers):
+            return [config_files[int(n) - 1] for n in dict.fromkeys(numbers)]
+        write_error_line(
+            f"Invalid input. Please enter numbers between 1 and {len(config_files)} separated by spaces."
+        )
+
+
+def select_config() -> str:
+    """
+    Picks the config whose stake currency and pair_blacklist the window pairlists use.
+    """
+    config_files = sorted(
+        glob.glob(os.path.join(PROJECT_ROOT, CONFIG_FOLDER, "config-*.json"))
+    )
+    if not config_files:
+        write_error_line(f"No config-*.json files found in '{CONFIG_FOLDER}'.")
+        return None
+
+    while True:
+        write_action_line("Available Configs:")
+        for index, cfg in enumerate(config_files, start=1):
+            write_info_line(f"{index}. {os.path.basename(cfg)}")
+        choice = input("Enter the config to take the stake currency and blacklist from: ").strip()
+        if choice.isdigit() and 1 <= int(choice) <= len(config_files):
+            return config_files[int(choice) - 1]
+        write_error_line(f"Invalid input. Please enter a number between 1 and {len(config_files)}.")
+
+
+# =====================================================================================
+# Config helpers
+# =====================================================================================
+def is_blacklisted(pair: str, blacklist: list) -> bool:
+    return any(re.fullmatch(pattern, pair) for pattern in blacklist)
+
+
+def skip_json_space(content: str, index: int) -> int:
+    """
+    Returns the index of the next character that is not whitespace or part of a // comment.
+    """
+    while index < len(content):
+        if content[index].isspace():
+            index += 1
+        elif content.startswith("//", index):
+            end = content.find("\n", index)
+            index = len(content) if end == -1 else end
+        else:
+            break
+    return index
+
+
+def find_json_block_end(content: str, start: int) -> int:
+    """
+    Returns the index just after the [...] or {...} that opens at start,
+    skipping strings and // comments.
+    """
+    depth = 0
+    in_string = False
+    index = start
+    while index < len(content):
+        char = content[index]
+        if in_string:
+            if char == "\\":
+                index += 1
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif content.startswith("//", index):
+            index = skip_json_space(content, index)
+            continue
+        elif char in "[{":
+            depth += 1
+        elif char in "]}":
+            depth -= 1
+            if depth == 0:
+                return index + 1
+        index += 1
+    raise ValueError("unbalanced brackets")
+
+
+def find_json_value(content: str, key: str):
+    """
+    Returns (start, end) of the array or object stored under key.
+    """
+    m = re.search(rf'"{re.escape(key)}"\s*:', content)
+    if not m:
+        raise ValueError(f"no '{key}' found")
+    start = skip_json_space(content, m.end())
+    if content[start] not in "[{":
+        raise ValueError(f"'{key}' is not a list")
+    return start, find_json_block_end(content, start)
+
+
+def write_config_whitelist(path: str, pairs: list):
+    """
+    Writes pairs as the config's pair_whitelist and makes StaticPairList the
+    pairlist generator. The text is edited in place, so comments and the
+    filters that follow the generator are kept.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        content = f.read()
+
+    # The generator is always the first entry of the pairlist chain
+    start, end = find_json_value(content, "pairlists")
+    first = skip_json_space(content, start + 1)
+    generator = '{"method": "StaticPairList"}'
+    if content[first] == "{":
+        content = content[:first] + generator + content[find_json_block_end(content, first):]
+    else:
+        content = content[:first] + generator + (", " if content[first] != "]" else "") + content[first:]
+
+    start, end = find_json_value(content, "pair_whitelist")
+    line_start = content.rfind("\n", 0, start) + 1
+    indent = re.match(r"[ \t]*", content[line_start:]).group(0)
+    items = ",\n".join(f'{indent}    "{pair}"' for pair in pairs)
+    content = content[:start] + f"[\n{items}\n{indent}]" + content[end:]
+
+    # Refuse to write anything freqtrade could not load
+    json.loads(re.sub(r"^\s*//.*$", "", content, flags=re.MULTILINE))
+
+    shutil.copy2(path, path + ".bak")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+
+
+# =====================================================================================
+# Pair metrics (runs in worker processes)
+# =====================================================================================
+def file_to_pair(path: str):
+    """
+    BTC_USDT-1h.feather -> BTC/USDT (spot files only)
+    """
+    m = re.match(r"^([A-Z0-9]+)_([A-Z0-9]+)-\w+\.feather$", os.path.basename(path))
+    return f"{m.group(1)}/{m.group(2)}" if m else None
+
+
+def compute_pair_metrics(path: str, rank_points: list, lookback_ms: int, min_age_ms: int):
+    """
+    Computes quote volume, age, last price and volatility of one pair at every
+    rank point, each over the lookback window that ends right before it.
+    """
+    table = feather.read_table(path, columns=["date", "close", "volume"], memory_map=True)
+    if table.num_rows < 2:
+        return None
+
+    dates = read_dates_ms(table)
+    close = table.column("close").combine_chunks().to_numpy(zero_copy_only=False).astype(float)
+    volume = table.column("volume").combine_chunks().to_numpy(zero_copy_only=False).astype(float)
+
+    points = np.asarray(rank_points, dtype=np.int64)
+    starts = np.searchsorted(dates, points - lookback_ms, side="left")
+    ends = np.searchsorted(dates, points, side="left")
+
+    quote_volume = np.concatenate(([0.0], np.cumsum(volume * close)))
+    log_returns = np.concatenate(([0.0], np.diff(np.log(np.where(close > 0, close, np.nan)))))
+
+    volatility = []
+    for start, end in zip(starts, ends):
+        window = log_returns[start + 1:end]
+        window = window[np.isfinite(window)]
+        volatility.append(float(window.std()) if window.size > 1 else None)
+
+    return {
+        "quote_volume": (quote_volume[ends] - quote_volume[starts]).tolist(),
+        "age_ok": (dates[0] <= points - min_age_ms).tolist(),
+        "price": [float(close[e - 1]) if e > 0 else None for e in ends],
+        "volatility": volatility,
+    }
+
+
+def rank_pairs(settings: dict, rank_points: list, quote_currency: str, blacklist: list) -> list:
+    """
+    Returns, for every rank point, the top pairs by quote volume that pass the filters.
+    """
+    files = {}
+    for path in glob.glob(os.path.join(DATA_FOLDER, f"*-{settings['timeframe']}.feather")):
+        pair = file_to_pair(path)
+        if pair and pair.endswith(f"/{quote_currency}") and not is_blacklisted(pair, blacklist):
+            files[pair] = path
+
+    if not files:
+        write_error_line(f"No {quote_currency} pairs found for {settings['timeframe']}.")
+        return [[] for _ in rank_points]
+
+    lookback_ms = settings["lookback_days"] * DAY_MS
+    min_age_ms = settings["min_age_days"] * DAY_MS
+    pairs = sorted(files)
+    write_action_line(f"Ranking {len(pairs)} pair(s) at {len(rank_points)} point(s)...")
+
+    with ProcessPoolExecutor() as pool:
+        metrics = list(
+            pool.map(
+                compute_pair_metrics,
+                [files[p] for p in pairs],
+                [rank_points] * len(pairs),
+                [lookback_ms] * len(pairs),
+                [min_age_ms] * len(pairs),
+                chunksize=max(1, len(pairs) // (4 * (os.cpu_count() or 1))),
+            )
+        )
+
+    rankings = []
+    for i in range(len(rank_points)):
+        candidates = []
+        for pair, m in zip(pairs, metrics):
+            if m is None or not m["age_ok"][i] or m["quote_volume"][i] <= 0:
+                continue
+            price, volatility = m["price"][i], m["volatility"][i]
+            if price is None or price < settings["min_price"]:
+                continue
+            if volatility is None or not (
+                settings["min_volatility"] <= volatility <= settings["max_volatility"]
+            ):
+                continue
+            candidates.append((m["quote_volume"][i], pair))
+        candidates.sort(reverse=True)
+        rankings.append([pair for _, pair in candidates[: settings["number_assets"]]])
+    return rankings
+
+
+# =====================================================================================
+# Modes
+# =====================================================================================
+def get_latest_candle_ms(timeframe: str) -> int:
+    """
+    Returns a rank point just after the newest candle in the data, so the
+    lookback window ends with the latest downloaded data.
+    """
+    latest = 0
+    for path in glob.glob(os.path.join(DATA_FOLDER, f"*-{timeframe}.feather")):
+        dates = read_dates_ms(feather.read_table(path, columns=["date"], memory_map=True))
+        if len(dates):
+            latest = max(latest, int(dates[-1]))
+    if not latest:
+        return int(datetime.now(timezone.utc).timestamp() * 1000)
+    return latest + 1
+
+
+def refresh_config_whitelists(settings: dict):
+    configs = select_configs()
+    if not configs:
+        return
+
+    for path in configs:
+        config = load_json_config(path)
+        quote_currency = config.get("stake_currency", "USDT")
+        blacklist = config.get("exchange", {}).get("pair_blacklist", [])
+
+        rank_point = get_latest_candle_ms(settings["timeframe"])
+        pairs = rank_pairs(settings, [rank_point], quote_currency, blacklist)[0]
+        if not pairs:
+            write_error_line(f"No pairs passed the filters for {os.path.basename(path)}.")
+            continue
+
+        try:
+            write_config_whitelist(path, pairs)
+        except ValueError as e:
+            write_error_line(f"Could not update {os.path.basename(path)}: {e}")
+            continue
+        write_tell(f"{os.path.basename(path)}: {len(pairs)} pair(s) written (backup in .bak)")
+        write_info_line(", ".join(pairs))
+
+
+def build_window_pairlists(settings: dict):
+    timerange = get_timerange()
+    window_days = get_number("Window length in days", DEFAULT_WINDOW_DAYS, int) or DEFAULT_WINDOW_DAYS
+    config_path = select_config()
+    if not config_path:
+        return
+    config = load_json_config(config_path)
+    quote_currency = config.get("stake_currency", "USDT")
+    blacklist = config.get("exchange", {}).get("pair_blacklist", [])
+
+    start_str, end_str = timerange.split("-")
+    start = datetime.strptime(start_str, "%Y%m%d").replace(tzinfo=timezone.utc)
+    end = datetime.strptime(end_str, "%Y%m%d").replace(tzinfo=timezone.utc)
+
+    windows = []
+    window_start = start
+    while window_start < end:
+        window_end = min(window_start + timedelta(days=window_days), end)
+        windows.append((window_start, window_end))
+        window_start = window_end
+
+    # Each window is ranked on the data before it starts, so there is no lookahead
+    rank_points = [int(s.timestamp() * 1000) for s, _ in windows]
+    rankings = rank_pairs(settings, rank_points, quote_currency, blacklist)
+
+    os.makedirs(PAIRLISTS_FOLDER, exist_ok=True)
+    output = os.path.join(
+        PAIRLISTS_FOLDER, f"pairlist_{quote_currency}_{settings['timeframe']}_{timerange}.json"
+    )
+    result = {
+        "settings": settings,
+        "config": os.path.basename(config_path),
+        "windows": [
+            {"timerange": f"{s:%Y%m%d}-{e:%Y%m%d}", "pairs": pairs}
+            for (s, e), pairs in zip(windows, rankings)
+        ],
+    }
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=4)
+
+    for window in result["windows"]:
+        write_info_line(f"{window['timerange']}: {len(window['pairs'])} pair(s)")
+    write_tell(f"Window pairlists written to {output}")
+    write_info_line("Backtest a window with: backtesting --timerange <window> --pairs <pairs>")
+
+
+# =====================================================================================
+# Main flow
+# =====================================================================================
+def main():
+    if np is None:
+        write_error_line("This script needs numpy and pyarrow: pip install numpy pyarrow")
+        sys.exit(1)
+
+    ensure_working_directory()
+
+    while True:
+        write_action_line("Choose what to generate:")
+        write_warning_line("1:   Refresh config whitelists  - Rank on the latest data and write StaticPairList configs.")
+        write_warning_line("2:   Window pairlists           - One pairlist per backtest window, ranked on the data before it.")
+        write_warning_line("3:   Exit")
+        choice = input("Enter your choice: ").strip()
+
+        if choice == "1":
+            refresh_config_whitelists(get_settings())
+        elif choice == "2":
+            build_window_pairlists(get_settings())
+        elif choice == "3":
+            write_info_line("Exiting...")
+            break
+        else:
+            write_error_line("Invalid choice. Please enter a number between 1 and 3.")
+
+
+if __name__ == "__main__":
+    main()
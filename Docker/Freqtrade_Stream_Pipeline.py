@@ -0,0 +1,455 @@
+#!/usr/bin/env python
+import os
+import re
+import glob
+import json
+import sys
+import time
+import threading
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import Freqtrade_Backtest as backtest
+import Freqtrade_Hyperopt as hyperopt
+from Freqtrade_Cpu_Planner import planned_cpus
+from Freqtrade_Run_History import get_strategy_timeframe, load_backtest_result, load_json_config
+
+# =====================================================================================
+# Basic colored output (works in modern Windows terminals with ANSI support)
+# =====================================================================================
+RESET = "\033[0m"
+RED = "\033[31m"
+WHITE = "\033[37m"
+YELLOW = "\033[33m"
+GREEN = "\033[32m"
+BLUE = "\033[34m"
+
+
+def write_error_line(msg: str):
+    print(f"{RED}{msg}{RESET}")
+
+
+def write_info_line(msg: str):
+    print(f"{WHITE}{msg}{RESET}")
+
+
+def write_warning_line(msg: str):
+    print(f"{YELLOW}{msg}{RESET}")
+
+
+def write_action_line(msg: str):
+    print(f"{GREEN}{msg}{RESET}")
+
+
+def write_tell(msg: str):
+    print(f"{BLUE}{msg}{RESET}")
+
+
+# =====================================================================================
+# Config / path constants
+# =====================================================================================
+PROJECT_ROOT = r"K:\Freqtrade"
+CONFIG_FOLDER = "user_data"  # relative (as seen inside container)
+BACKTEST_RESULTS_FOLDER = os.path.join(PROJECT_ROOT, "user_data", "backtest_results")
+# The download script's file name has spaces, so it is loaded by path
+DOWNLOAD_SCRIPT = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "Freqtrade_Download_Data (feather, KUCOIN).py"
+)
+
+DEFAULT_SHARD_SIZE = 10
+MAX_PARALLEL_JOBS = 4
+POLL_SECONDS = 5
+
+
+def ensure_working_directory():
+    if os.getcwd().lower() != PROJECT_ROOT.lower():
+        write_warning_line(f"Switching to expected working directory: {PROJECT_ROOT}")
+        try:
+            os.chdir(PROJECT_ROOT)
+        except Exception as e:
+            write_error_line(f"Failed to change directory to {PROJECT_ROOT}. {e}")
+            sys.exit(1)
+
+
+def load_download_module():
+    spec = importlib.util.spec_from_file_location("freqtrade_download_data", DOWNLOAD_SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# =====================================================================================
+# User input
+# =====================================================================================
+def select_configs(prompt: str, allow_none: bool = False) -> list:
+    config_files = sorted(glob.glob(os.path.join(PROJECT_ROOT, CONFIG_FOLDER, "config-*.json")))
+    if not config_files:
+        write_error_line(f"No config-*.json files found in '{CONFIG_FOLDER}'.")
+        return []
+
+    while True:
+        write_action_line(prompt)
+        for index, cfg in enumerate(config_files, start=1):
+            write_info_line(f"{index}. {os.path.basename(cfg)}")
+
+        hint = "e.g. 1 3 4, 'all'" + (", Enter = none" if allow_none else "")
+        choice = input(f"Enter the configs ({hint}): ").strip().lower()
+        if not choice and allow_none:
+            return []
+        if choice == "all":
+            return config_files
+        numbers = choice.split()
+        if numbers and all(n.isdigit() and 1 <= int(n) <= len(config_files) for n in numbers):
+            return [config_files[int(n) - 1] for n in dict.fromkeys(numbers)]
+        write_error_line(
+            f"Invalid input. Please enter numbers between 1 and {len(config_files)} separated by spaces."
+        )
+
+
+def get_shard_size() -> int:
+    while True:
+        write_action_line(f"Pairs per backtest shard (default {DEFAULT_SHARD_SIZE}):")
+        value = input().strip()
+        if not value:
+            return DEFAULT_SHARD_SIZE
+        if value.isdigit() and int(value) > 0:
+            return int(value)
+        write_error_line("Invalid input. Please enter a positive integer.")
+
+
+def get_job_timerange() -> str:
+    pattern = re.compile(r"^\d{8}-\d{8}$")
+    while True:
+        write_action_line(
+            f"Enter the backtest/hyperopt timerange (YYYYMMDD-YYYYMMDD, default {backtest.DEFAULT_TIMERANGE}):"
+        )
+        timerange = input().strip()
+        if not timerange:
+            return backtest.DEFAULT_TIMERANGE
+        if pattern.match(timerange):
+            return timerange
+        write_error_line("Invalid input. Please enter the timerange in the format YYYYMMDD-YYYYMMDD.")
+
+
+# =====================================================================================
+# Jobs
+# =====================================================================================
+def get_data_requirements(config_path: str):
+    """
+    Returns (pairs, timeframes) a config needs: its static whitelist and the
+    strategy timeframe, plus timeframe_detail when set.
+    """
+    config = load_json_config(config_path)
+    pairs = config.get("exchange", {}).get("pair_whitelist", [])
+    timeframe = config.get("timeframe") or get_strategy_timeframe(config.get("strategy", ""))
+    timeframes = [tf for tf in (timeframe, config.get("timeframe_detail")) if tf]
+    return pairs, timeframes
+
+
+def build_jobs(
+    backtest_configs: list,
+    hyperopt_configs: list,
+    shard_size: int,
+    download_timeframes: list,
+) -> list:
+    """
+    One job per backtest shard (a slice of the whitelist, run with --pairs)
+    and one per hyperopt, which needs the whole whitelist.
+    """
+    jobs = []
+    for kind, configs in (("backtest", backtest_configs), ("hyperopt", hyperopt_configs)):
+        for path in configs:
+            config_name = os.path.basename(path)
+            try:
+                pairs, timeframes = get_data_requirements(path)
+            except Exception as e:
+                write_error_line(f"Skipping {config_name}: {e}")
+                continue
+            if not pairs or not timeframes:
+                write_warning_line(f"Skipping {config_name}: no pair_whitelist or timeframe found.")
+                continue
+
+            missing = [tf for tf in timeframes if tf not in download_timeframes]
+            if missing:
+                write_warning_line(
+                    f"{config_name} needs {', '.join(missing)}, which is not downloaded; "
+                    f"the existing local data is used."
+                )
+            needed = [tf for tf in timeframes if tf in download_timeframes]
+
+            stem = os.path.splitext(config_name)[0]
+            if kind == "hyperopt":
+                shards = [pairs]
+            else:
+                shards = [pairs[i:i + shard_size] for i in range(0, len(pairs), shard_size)]
+            for index, shard in enumerate(shards, start=1):
+                name = f"Pipeline_{kind.capitalize()}_{stem}"
+                if len(shards) > 1:
+                    name += f"_{index}"
+                jobs.append(
+                    {
+                        "name": name,
+                        "kind": kind,
+                        "config_file": f"{CONFIG_FOLDER}/{config_name}",
+                        "pairs": shard,
+                        "timeframes": needed,
+                        "sharded": len(shards) > 1,
+                        "state": "waiting",
+                    }
+                )
+    return jobs
+
+
+def get_missing_data(job: dict, completed: dict) -> list:
+    return [
+        f"{pair} {tf}"
+        for pair in job["pairs"]
+        for tf in job["timeframes"]
+        if tf not in completed.get(pair, [])
+    ]
+
+
+def get_download_pairs(jobs: list) -> list:
+    """
+    Union of the pairs all jobs need, in first-seen order. Downloaded with
+    --pairs so configs with other whitelists than config-1.json get their data.
+    """
+    return list(dict.fromkeys(pair for job in jobs for pair in job["pairs"]))
+
+
+def read_job_results(export_dir: str) -> dict:
+    _, result = load_backtest_result(export_dir)
+    if not result:
+        return {}
+    return {
+        strategy: {
+            "total_trades": data.get("total_trades"),
+            "profit_total": data.get("profit_total"),
+            "max_drawdown_account": data.get("max_drawdown_account"),
+        }
+        for strategy, data in result.get("strategy", {}).items()
+    }
+
+
+def write_pipeline_summary(jobs: list, export_root: str, download_exit_code):
+    """
+    Writes summary.json next to the backtest results. Shard results are
+    labelled as such: max_open_trades and the stake apply per shard, so they
+    cannot be added up to a full-whitelist result.
+    """
+    summary_dir = os.path.join(BACKTEST_RESULTS_FOLDER, export_root)
+    os.makedirs(summary_dir, exist_ok=True)
+    summary = {
+        "download_exit_code": download_exit_code,
+        "jobs": [
+            {
+                "name": job["name"],
+                "kind": job["kind"],
+                "config_file": job["config_file"],
+                "pairs": job["pairs"],
+                "shard_result": job["sharded"],
+                "ready_after": job.get("ready_after"),
+                "results": job.get("results", {}),
+            }
+            for job in jobs
+        ],
+    }
+    with open(os.path.join(summary_dir, "summary.json"), "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=4)
+
+
+def run_job(job: dict, timerange: str, export_root: str, hyperopt_settings: dict):
+    started = time.time()
+    write_tell(f"Starting {job['name']} ({len(job['pairs'])} pair(s)).")
+
+    if job["kind"] == "backtest":
+        export_dir = os.path.join(BACKTEST_RESULTS_FOLDER, export_root, job["name"])
+        os.makedirs(export_dir, exist_ok=True)
+        backtest.run_docker_command(
+            job["name"],
+            timerange,
+            backtest.DEFAULT_USE_CACHE,
+            False,
+            False,
+            job["config_file"],
+            export_dir=f"{CONFIG_FOLDER}/backtest_results/{export_root}/{job['name']}",
+            # Only a shard needs an explicit pair list, a full run keeps the config's pairlist
+            pairs=job["pairs"] if job["sharded"] else None,
+        )
+        job["results"] = read_job_results(export_dir)
+    else:
+        workers = hyperopt_settings["workers"]
+        with planned_cpus(job["name"], workers) as cpus:
+            if cpus:
+                workers = min(workers, len(cpus))
+            hyperopt.run_hyperopt_container(
+                job["name"],
+                timerange,
+                hyperopt_settings["spaces"].split(),
+                hyperopt_settings["epochs"],
+                workers,
+                hyperopt_settings["hyperopt_loss"],
+                job["config_file"],
+                [],
+            )
+
+    write_tell(f"{job['name']} finished in {time.time() - started:.0f}s.")
+    return job
+
+
+def run_pipeline(
+    download,
+    download_settings: tuple,
+    download_pairs: list,
+    jobs: list,
+    timerange: str,
+    hyperopt_settings: dict,
+):
+    """
+    Starts the download, then polls its status file and launches each job as
+    soon as all the pairs/timeframes it needs are complete. Jobs still waiting
+    when the download ends are started on the data that exists.
+    """
+    pipeline_started = time.time()
+    export_root = f"pipeline_{datetime.now():%Y%m%d_%H%M%S}"
+
+    download_result = {}
+
+    def download_worker():
+        download_result["exit_code"] = download.run_docker_command(*download_settings, pairs=download_pairs)
+
+    download_thread = threading.Thread(target=download_worker, daemon=True)
+    download_thread.start()
+
+    futures = []
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_JOBS) as executor:
+        while any(job["state"] == "waiting" for job in jobs):
+            status = download.read_download_status()
+            if status and status.get("started_at", 0) < pipeline_started:
+                # Left over from an earlier download
+                status = None
+            completed = status.get("completed", {}) if status else {}
+            finished = not download_thread.is_alive()
+
+            for job in jobs:
+                if job["state"] != "waiting":
+                    continue
+                missing = get_missing_data(job, completed)
+                if missing and not finished:
+                    continue
+                if missing:
+                    shown = ", ".join(missing[:5]) + (" ..." if len(missing) > 5 else "")
+                    write_warning_line(
+                        f"{job['name']}: download ended without {shown}; starting on existing data."
+                    )
+                job["state"] = "running"
+                job["ready_after"] = time.time() - pipeline_started
+                futures.append(executor.submit(run_job, job, timerange, export_root, hyperopt_settings))
+
+            if any(job["state"] == "waiting" for job in jobs):
+                time.sleep(POLL_SECONDS)
+
+        for future in futures:
+            try:
+                future.result()
+            except Exception as e:
+                write_error_line(f"Pipeline job failed: {e}")
+
+    download_thread.join()
+    total = time.time() - pipeline_started
+
+    write_action_line("Pipeline summary:")
+    if download_result.get("exit_code") not in (0, None):
+        write_warning_line(f"Download exited with code {download_result['exit_code']}.")
+    for job in jobs:
+        line = f"{job['name']:<45} started after {job.get('ready_after', 0):>6.0f}s"
+        for strategy, metrics in job.get("results", {}).items():
+            profit = metrics["profit_total"]
+            drawdown = metrics["max_drawdown_account"]
+            line += (
+                f"  {strategy}: trades={metrics['total_trades'] or 0}"
+                f" profit={f'{profit:.2%}' if profit is not None else '-'}"
+                f" drawdown={f'{drawdown:.2%}' if drawdown is not None else '-'}"
+            )
+        if job["sharded"]:
+            line += "  (shard result)"
+        write_info_line(line)
+    write_pipeline_summary(jobs, export_root, download_result.get("exit_code"))
+    write_tell(f"Download and jobs finished in {total:.0f}s. Backtest results: backtest_results/{export_root}")
+
+
+# =====================================================================================
+# Main flow
+# =====================================================================================
+def get_download_settings(download) -> tuple:
+    if download.choose_parameter_mode():
+        return (
+            download.DEFAULT_TIMERANGE,
+            download.DEFAULT_TIMEFRAMES,
+            download.DEFAULT_INCLUDE_INACTIVE_PAIRS,
+        )
+    return (
+        download.get_timerange(),
+        download.get_timeframes(),
+        download.get_include_inactive_pairs(),
+    )
+
+
+def main():
+    ensure_working_directory()
+    download = load_download_module()
+
+    write_tell("Download settings:")
+    download_settings = get_download_settings(download)
+    download_timeframes = download_settings[1].split()
+
+    backtest_configs = select_configs("Configs to backtest as their data arrives:", allow_none=True)
+    hyperopt_configs = select_configs("Configs to hyperopt as their data arrives:", allow_none=True)
+    if not backtest_configs and not hyperopt_configs:
+        write_error_line("No configs selected. Exiting...")
+        return
+
+    shard_size = get_shard_size() if backtest_configs else DEFAULT_SHARD_SIZE
+    timerange = get_job_timerange()
+
+    hyperopt_settings = {}
+    if hyperopt_configs:
+        hyperopt_settings = {
+            "spaces": hyperopt.get_spaces(),
+            "epochs": hyperopt.get_epochs(),
+            "workers": hyperopt.get_workers(),
+            "hyperopt_loss": hyperopt.get_hyperopt_loss(),
+        }
+        if hyperopt_settings["hyperopt_loss"] == "Custom":
+            custom_loss = hyperopt.get_custom_hyperopt_loss(hyperopt.HYPEROPTS_FOLDER)
+            if not custom_loss:
+                write_error_line("No custom loss selected or could not parse class. Exiting...")
+                return
+            hyperopt_settings["hyperopt_loss"] = custom_loss
+
+    jobs = build_jobs(backtest_configs, hyperopt_configs, shard_size, download_timeframes)
+    if not jobs:
+        write_error_line("None of the selected configs can be run. Exiting...")
+        return
+
+    write_action_line(f"{len(jobs)} job(s) wait for their data:")
+    for job in jobs:
+        write_info_line(
+            f"{job['name']:<45} {len(job['pairs'])} pair(s), {', '.join(job['timeframes']) or '-'}"
+        )
+
+    if any(job["sharded"] for job in jobs):
+        write_warning_line(
+            "Sharded backtests apply max_open_trades and the stake per shard; their results "
+            "are shard results and do not add up to a full-whitelist backtest."
+        )
+
+    download_pairs = get_download_pairs(jobs)
+    write_tell(f"Downloading {len(download_pairs)} pair(s) needed by the selected configs.")
+
+    run_pipeline(download, download_settings, download_pairs, jobs, timerange, hyperopt_settings)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,33 @@
+# Optional parameters for non-interactive use (e.g. from Freqtrade_Promote.py):
+#   -BotNames "name 1","name 2"  only deploy to these bots
+#   -Strategies "a.py","a.json"  copy these files instead of the distribution file entries
+#   -DistributionFile "...json"  read the bot/strategy mapping from this file
+#   -NoPrompt                    do not wait for Enter at the end
+param(
+    [string[]]$BotNames = @(),
+    [string[]]$Strategies = @(),
+    [string]$DistributionFile = "",
+    [switch]$NoPrompt
+)
+
+# powershell -File passes "a,b" as one string, so split it here
+$BotNames = @($BotNames | ForEach-Object { $_ -split ',' } | Where-Object { $_ })
+$Strategies = @($Strategies | ForEach-Object { $_ -split ',' } | Where-Object { $_ })
+$exitCode = 0
+
 # Define your bots and their details
 $bots = @(
-    @{ "name" = "name 1"; "ip" = "       "; "username" = "         "; "destination_dir" = "/home/.../Servers/Freqtrade/user_data/strategies" },
-    @{ "name" = "name 2"; "ip" = "       "; "username" = "         "; "destination_dir" = "/home/.../Servers/Freqtrade/user_data/strategies" },
-    @{ "name" = "name 3"; "ip" = "       "; "username" = "         "; "destination_dir" = "/home/.../Freqtrade/user_data/strategies" },
-    @{ "name" = "name 4"; "ip" = "       "; "username" = "         "; "destination_dir" = "/home/..../Freqtrade/user_data/strategies" },
-    @{ "name" = "name 5"; "ip" = "       "; "username" = "         "; "destination_dir" = "/media/..../Space/user_data/strategies" }
+    @{ "name" = "name 1"; "ip" = "       "; "username" = "         "; "destination_dir" = "/home/.../Servers/Freqtrade/user_data/strategies"; "api_url" = "http://       :8080"; "api_username" = "         "; "api_password" = "         " },
+    @{ "name" = "name 2"; "ip" = "       "; "username" = "         "; "destination_dir" = "/home/.../Servers/Freqtrade/user_data/strategies"; "api_url" = "http://       :8080"; "api_username" = "         "; "api_password" = "         " },
+    @{ "name" = "name 3"; "ip" = "       "; "username" = "         "; "destination_dir" = "/home/.../Freqtrade/user_data/strategies"; "api_url" = "http://       :8080"; "api_username" = "         "; "api_password" = "         " },
+    @{ "name" = "name 4"; "ip" = "       "; "username" = "         "; "destination_dir" = "/home/..../Freqtrade/user_data/strategies"; "api_url" = "http://       :8080"; "api_username" = "         "; "api_password" = "         " },
+    @{ "name" = "name 5"; "ip" = "       "; "username" = "         "; "destination_dir" = "/media/..../Space/user_data/strategies"; "api_url" = "http://       :8080"; "api_username" = "         "; "api_password" = "         " }
 )
 $source_dir = "C:\Users\...\Freqtrade\user_data\strategies"
 $strategy_distribution_file = "X:\...\...\strategy_distribution.json"
+if ($DistributionFile) {
+    $strategy_distribution_file = $DistributionFile
+}
 
 # Load strategy distribution from the JSON file
 $strategy_distribution = Get-Content $strategy_distribution_file | ConvertFrom-Json
@@ -31,6 +51,10 @@ function Select-Bots {
     }
     Write-Host "Enter '-1' to select all bots."
 
+    if ($BotNames.Count -gt 0) {
+        return $bots | Where-Object { $BotNames -contains $_.name }
+    }
+
     if ($useDefaults -and $defaultSelection -eq '-1') {
         return $bots
     }
@@ -61,7 +85,126 @@ function Select-Bots {
     return $selections | ForEach-Object { $bots[$_ - 1] }
 }
 
-# Function to copy strategies to the selected bot(s)
+# Functions used inside the deploy jobs (each bot is handled by its own background job)
+$deployFunctions = {
+    function Invoke-Remote {
+        param($bot, [string]$command)
+        & ssh -o BatchMode=yes "$($bot.username)@$($bot.ip)" $command 2>&1 | ForEach-Object { Write-Host "    [$($bot.name)] $_" }
+        return ($LASTEXITCODE -eq 0)
+    }
+
+    function Invoke-BotReload {
+        param($bot)
+        if (-not $bot.api_url) {
+            Write-Host "[$($bot.name)] No api_url defined, reload skipped." -ForegroundColor Yellow
+            return $true
+        }
+        $pair = "$($bot.api_username):$($bot.api_password)"
+        $headers = @{ Authorization = "Basic " + [Convert]::ToBase64String([Text.Encoding]::ASCII.GetBytes($pair)) }
+        try {
+            $response = Invoke-RestMethod -Method Post -Uri ($bot.api_url.TrimEnd('/') + "/api/v1/reload_config") -Headers $headers -TimeoutSec 30
+            Write-Host "[$($bot.name)] $($response.status)"
+            return $true
+        } catch {
+            Write-Host "[$($bot.name)] Reload failed: $_" -ForegroundColor Red
+            return $false
+        }
+    }
+
+    # Phase 1: upload into a staging directory next to destination_dir and check the files there
+    function Publish-Staging {
+        param($plan)
+        $bot = $plan.bot
+        $result = { param($success, $message) [pscustomobject]@{ Name = $bot.name; Success = $success; Message = $message } }
+
+        if (-not (Invoke-Remote $bot "mkdir -p '$($plan.staging)'")) {
+            return & $result $false "could not create $($plan.staging)"
+        }
+
+        Write-Host "[$($bot.name)] Uploading $($plan.names -join ', ') to $($bot.ip):$($plan.staging)"
+        & scp -o BatchMode=yes -q @($plan.files) "$($bot.username)@$($bot.ip):$($plan.staging)/" 2>&1 | ForEach-Object { Write-Host "    [$($bot.name)] $_" }
+        if ($LASTEXITCODE -ne 0) {
+            return & $result $false "upload failed"
+        }
+
+        # Remote shell snippets avoid double quotes, Windows PowerShell mangles them when calling ssh
+        $check = @'
+cd '{STAGING}' || exit 1
+for f in *.py; do [ -e $f ] || continue; python3 -m py_compile $f || exit 1; done
+for f in *.json; do [ -e $f ] || continue; python3 -m json.tool $f > /dev/null || exit 1; done
+rm -rf __pycache__
+'@
+        $check = $check.Replace('{STAGING}', $plan.staging)
+        if (-not (Invoke-Remote $bot $check)) {
+            return & $result $false "compile check failed"
+        }
+        return & $result $true "staged"
+    }
+
+    # Phase 2: back up the live files, swap in the staged ones with mv (an atomic rename), reload the bot
+    function Switch-Live {
+        param($plan)
+        $bot = $plan.bot
+        $result = { param($success, $message) [pscustomobject]@{ Name = $bot.name; Success = $success; Message = $message } }
+        $names = ($plan.names | ForEach-Object { "'$_'" }) -join ' '
+
+        $swap = @'
+set -e
+mkdir -p '{BACKUP}'
+: > '{BACKUP}/.new'
+for f in {NAMES}; do
+    if [ -e '{DEST}'/$f ]; then cp -p '{DEST}'/$f '{BACKUP}'/$f; else echo $f >> '{BACKUP}/.new'; fi
+done
+for f in {NAMES}; do mv -f '{STAGING}'/$f '{DEST}'/$f; done
+rm -rf '{STAGING}'
+'@
+        $rollback = @'
+cd '{BACKUP}' || exit 1
+for f in *; do [ -e $f ] && mv -f $f '{DEST}'/$f; done
+while read -r f; do [ -z $f ] || rm -f '{DEST}'/$f; done < .new
+cd / && rm -rf '{BACKUP}' '{STAGING}'
+'@
+        $swap, $rollback = @($swap, $rollback) | ForEach-Object {
+            $_.Replace('{BACKUP}', $plan.backup).Replace('{STAGING}', $plan.staging).Replace('{DEST}', $bot.destination_dir).Replace('{NAMES}', $names)
+        }
+
+        if ((Invoke-Remote $bot $swap) -and (Invoke-BotReload $bot)) {
+            Invoke-Remote $bot "rm -rf '$($plan.backup)'" | Out-Null
+            return & $result $true "deployed and reloaded"
+        }
+
+        Write-Host "[$($bot.name)] Rolling back to the previous files..." -ForegroundColor Yellow
+        if (Invoke-Remote $bot $rollback) {
+            Invoke-BotReload $bot | Out-Null
+            return & $result $false "deploy failed, rolled back"
+        }
+        return & $result $false "deploy failed and rollback failed, check $($bot.destination_dir) and $($plan.backup)"
+    }
+
+    function Remove-Staging {
+        param($plan)
+        Invoke-Remote $plan.bot "rm -rf '$($plan.staging)'" | Out-Null
+    }
+}
+
+# Runs one job per bot at the same time and returns their results
+function Invoke-DeployJobs {
+    param(
+        [hashtable[]] $plans,
+        [string] $functionName
+    )
+
+    $jobs = foreach ($plan in $plans) {
+        Start-Job -InitializationScript $deployFunctions -ArgumentList $plan, $functionName -ScriptBlock {
+            param($plan, $functionName)
+            & $functionName $plan
+        }
+    }
+    return $jobs | Receive-Job -Wait -AutoRemoveJob
+}
+
+# Function to deploy strategies to the selected bot(s):
+# upload to staging on every host, check them, then swap atomically and reload each bot
 function Copy-Strategies {
     param (
         [Parameter(Mandatory = $true)]
@@ -69,38 +212,71 @@ function Copy-Strategies {
         $selectedBots
     )
 
+    $stamp = Get-Date -Format "yyyyMMdd-HHmmss"
+    $plans = @()
+
     foreach ($bot in $selectedBots) {
         $botName = $bot.name
         $strategiesToCopy = $strategy_distribution.$botName
+        if ($Strategies.Count -gt 0) {
+            $strategiesToCopy = $Strategies
+        }
 
         if ($null -eq $strategiesToCopy -or $strategiesToCopy.Count -eq 0) {
             Write-Host "No strategies defined for $($bot.name) in the distribution file." -ForegroundColor Yellow
             continue
         }
 
-        Write-Host "`nCopying strategies to $($bot.name) at $($bot.ip):"
+        Write-Host "`nDeploying strategies to $($bot.name) at $($bot.ip):"
         Write-Host "Destination Directory: $($bot.destination_dir)"
         Write-Host "Strategies to Copy:"
         $strategiesToCopy | ForEach-Object { Write-Host "    - $_" }
 
-        foreach ($strategyName in $strategiesToCopy) {
-            $local_path = Join-Path $source_dir $strategyName
-            if (-Not (Test-Path $local_path)) {
-                Write-Host "Strategy file not found: $local_path" -ForegroundColor Red
-                $operationCompletedSuccessfully = $false
-                continue
-            }
+        $missing = @($strategiesToCopy | Where-Object { -Not (Test-Path (Join-Path $source_dir $_)) })
+        if ($missing.Count -gt 0) {
+            $missing | ForEach-Object { Write-Host "Strategy file not found: $(Join-Path $source_dir $_)" -ForegroundColor Red }
+            throw "Missing strategy files for $($bot.name), nothing was deployed."
+        }
+
+        # Staging lives next to destination_dir so the final mv stays on the same filesystem
+        $parent = $bot.destination_dir.TrimEnd('/') -replace '/[^/]*$', ''
+        $plans += @{
+            bot     = $bot
+            names   = @($strategiesToCopy)
+            files   = @($strategiesToCopy | ForEach-Object { Join-Path $source_dir $_ })
+            staging = "$parent/.strategies-staging-$stamp"
+            backup  = "$parent/.strategies-backup-$stamp"
+        }
+    }
 
-            $remote_path = $bot.destination_dir + '/' + $strategyName
+    if ($plans.Count -eq 0) {
+        return
+    }
+
+    Write-Host "`nStaging on $($plans.Count) host(s)..."
+    $staged = @(Invoke-DeployJobs -plans $plans -functionName "Publish-Staging")
+    $failed = @($staged | Where-Object { -not $_.Success })
+    if ($failed.Count -gt 0) {
+        $failed | ForEach-Object { Write-Host "$($_.Name): $($_.Message)" -ForegroundColor Red }
+        Invoke-DeployJobs -plans $plans -functionName "Remove-Staging" | Out-Null
+        throw "Staging failed, no live files were changed."
+    }
 
-            # Construct and execute SCP command
-            Write-Host "`nCopying $($strategyName) to $($bot.ip):$remote_path"
-            $scp_command = "scp $local_path $($bot.username)@$($bot.ip):$remote_path"
-            Invoke-Expression $scp_command
+    Write-Host "`nSwapping in the new files and reloading $($plans.Count) bot(s)..."
+    $results = @(Invoke-DeployJobs -plans $plans -functionName "Switch-Live")
+    foreach ($result in $results) {
+        if ($result.Success) {
+            Write-Host "$($result.Name): $($result.Message)" -ForegroundColor Green
+        } else {
+            Write-Host "$($result.Name): $($result.Message)" -ForegroundColor Red
         }
+    }
 
-        Write-Host "`nAll specified strategies have been successfully copied to $($bot.name).`n" -ForegroundColor Green
+    $failed = @($results | Where-Object { -not $_.Success })
+    if ($failed.Count -gt 0) {
+        throw "Deploy failed on $($failed.Count) bot(s)."
     }
+    Write-Host "`nAll specified strategies have been deployed and reloaded.`n" -ForegroundColor Green
 }
 
 do {
@@ -112,13 +288,17 @@ do {
         Write-Host "Operation completed successfully."
     } catch {
         Write-Host "An error occurred: $_" -ForegroundColor Red
+        $exitCode = 1
     }
 
-    if (-not $useDefaults) {
+    if (-not $useDefaults -and $BotNames.Count -eq 0) {
         $continue = Read-Host "Do you want to select more bots? (Y/N)"
     } else {
         $continue = 'N'  # If using defaults, do not loop.
     }
 } while ($continue -eq 'Y')
 
-Read-Host -Prompt "Press Enter to exit"
+if (-not $NoPrompt) {
+    Read-Host -Prompt "Press Enter to exit"
+}
+exit $exitCode
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+"""
+Minimal stand-in for a bot's Freqtrade REST API, to try the distributor's
+reload step without a live bot. Point a bot's api_url at http://127.0.0.1:8080.
+
+    python mock_freqtrade_api.py [port] [--fail]
+
+--fail makes reload_config answer with an error, to test the rollback.
+"""
+import base64
+import json
+import sys
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+# =====================================================================================
+# Basic colored output (works in modern Windows terminals with ANSI support)
+# =====================================================================================
+RESET = "\033[0m"
+RED = "\033[31m"
+WHITE = "\033[37m"
+GREEN = "\033[32m"
+
+
+def write_error_line(msg: str):
+    print(f"{RED}{msg}{RESET}")
+
+
+def write_info_line(msg: str):
+    print(f"{WHITE}{msg}{RESET}")
+
+
+def write_action_line(msg: str):
+    print(f"{GREEN}{msg}{RESET}")
+
+
+# =====================================================================================
+# Defaults (match the api_username / api_password of the bot you test with)
+# =====================================================================================
+DEFAULT_PORT = 8080
+API_USERNAME = "freqtrader"
+API_PASSWORD = "freqtrader"
+
+
+class MockApiHandler(BaseHTTPRequestHandler):
+    fail_reload = False
+
+    def send_json(self, status: int, body: dict):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def is_authorized(self) -> bool:
+        expected = base64.b64encode(f"{API_USERNAME}:{API_PASSWORD}".encode("ascii")).decode("ascii")
+        return self.headers.get("Authorization") == f"Basic {expected}"
+
+    def do_GET(self):
+        if self.path == "/api/v1/ping":
+            self.send_json(200, {"status": "pong"})
+        else:
+            self.send_json(404, {"detail": "Not Found"})
+
+    def do_POST(self):
+        if self.path != "/api/v1/reload_config":
+            self.send_json(404, {"detail": "Not Found"})
+            return
+        if not self.is_authorized():
+            write_error_line("reload_config rejected: bad credentials")
+            self.send_json(401, {"detail": "Unauthorized"})
+            return
+        if self.fail_reload:
+            write_error_line("reload_config failed (--fail)")
+            self.send_json(500, {"detail": "Reload failed"})
+            return
+
+        write_action_line(f"{datetime.now():%H:%M:%S} reload_config received")
+        self.send_json(200, {"status": "Reloading config ..."})
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main():
+    args = [a for a in sys.argv[1:] if a != "--fail"]
+    port = int(args[0]) if args else DEFAULT_PORT
+    MockApiHandler.fail_reload = "--fail" in sys.argv[1:]
+
+    server = HTTPServer(("127.0.0.1", port), MockApiHandler)
+    write_info_line(f"Mock Freqtrade API listening on http://127.0.0.1:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        write_info_line("Exiting...")
+
+
+if __name__ == "__main__":
+    main()